@@ -1,15 +1,20 @@
 import os
-import pygame
 import sys
-import ctypes
 import time
 import math
 import json
-import platform
-import subprocess
 from enum import Enum
-from pygame.locals import *
-from tkinter import Tk, filedialog, messagebox
+
+# Heavy modules are imported on the code paths that need them: pygame by init_pygame(),
+# tkinter by the first-run prompts, ctypes by get_system_dpi() and subprocess by launch_game()
+pygame = None
+
+def init_pygame():
+    """Import and initialize pygame (with a small mixer buffer so sounds start right away)."""
+    global pygame
+    import pygame
+    pygame.mixer.pre_init(frequency=MIXER_FREQUENCY, size=-16, channels=2, buffer=MIXER_BUFFER_SIZE)
+    pygame.init()
 
 def get_heroic_launch_command(game_id):
 
@@ -27,6 +32,7 @@ ASSET_RESOLUTION = (1920, 1080)
 
 # Colors
 BLACK = (0, 0, 0)
+WHITE = (255, 255, 255)
 
 # File name for saving configuration
 CONFIG_FILE = "LauncherConfig.json"
@@ -75,6 +81,7 @@ class ConfirmState(Enum):
     OPENING = 1
     OPEN = 2
     CLOSING = 3
+    LAUNCHING = 4  # YES was chosen, waiting on the launch supervisor
 
 # Add these new global variables
 CONFIRM_STATE = ConfirmState.CLOSED
@@ -83,21 +90,64 @@ CONFIRM_SCALE_UP_SPEED = 3.0  # Adjust for faster/slower animation
 CONFIRM_SCALE_DOWN_SPEED = 8.0
 SELECTED_CONFIRM_BUTTON = "YES"  # Default to YES
 CONFIRM_ALPHA = 200  # For the black overlay (about 30% opacity)
+CONFIRM_KEYFRAMES = 16  # Pre-scaled box sizes used by the open/close animation
+LAUNCH_PULSE_SPEED = 4.0  # Glow pulse speed on YES while a launch is in progress
+
+# Overlay, animation keyframes and open-state widgets for the current canvas size
+confirm_frames = {}
+confirm_frames_size = None
 
 # Add these new image loading variables where you load other images
 def load_confirm_images():
     """Load confirm dialog images after pygame is initialized"""
     global CONFIRM_IMAGES
     CONFIRM_IMAGES = {
-        "BOX": pygame.image.load(os.path.join(os.path.dirname(__file__), "confirm-box.png")).convert_alpha(),
-        "TEXT": pygame.image.load(os.path.join(os.path.dirname(__file__), "confirm-text.png")).convert_alpha(),
-        "CURSOR": pygame.image.load(os.path.join(os.path.dirname(__file__), "confirm-cursor.png")).convert_alpha(),
-        "GLOW": pygame.image.load(os.path.join(os.path.dirname(__file__), "confirm-button-glow.png")).convert_alpha(),
-        "BUTTON_ACTIVE": pygame.image.load(os.path.join(os.path.dirname(__file__), "confirm-button-active.png")).convert_alpha(),
-        "BUTTON_INACTIVE": pygame.image.load(os.path.join(os.path.dirname(__file__), "confirm-button-inactive.png")).convert_alpha()
+        "BOX": load_image(os.path.join(os.path.dirname(__file__), "confirm-box.png")).convert_alpha(),
+        "TEXT": load_image(os.path.join(os.path.dirname(__file__), "confirm-text.png")).convert_alpha(),
+        "CURSOR": load_image(os.path.join(os.path.dirname(__file__), "confirm-cursor.png")).convert_alpha(),
+        "GLOW": load_image(os.path.join(os.path.dirname(__file__), "confirm-button-glow.png")).convert_alpha(),
+        "BUTTON_ACTIVE": load_image(os.path.join(os.path.dirname(__file__), "confirm-button-active.png")).convert_alpha(),
+        "BUTTON_INACTIVE": load_image(os.path.join(os.path.dirname(__file__), "confirm-button-inactive.png")).convert_alpha()
     }
 
 # Function to load existing configuration or return an empty dictionary
+class ConfigStore(dict):
+    """The launcher configuration. Remembers whether anything changed since it was loaded or last saved."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.changed = False
+
+    def __setitem__(self, key, value):
+        # Writing back the value a key already has is not a change
+        if key in self and self[key] == value:
+            return
+        super().__setitem__(key, value)
+        self.changed = True
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.changed = True
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key, *default):
+        if key in self:
+            self.changed = True
+        return super().pop(key, *default)
+
+    def clear(self):
+        if self:
+            self.changed = True
+        super().clear()
+
 def load_config():
     if os.path.exists(CONFIG_FILE):
         try:
@@ -105,23 +155,42 @@ def load_config():
                 config = json.load(f)
                 if not config:  # Handle empty file
                     print(f"Warning: {CONFIG_FILE} is empty. Starting with a fresh configuration.")
-                    return {}
-                return config
+                    return ConfigStore()
+                return ConfigStore(config)
         except json.JSONDecodeError:
             print(f"Warning: {CONFIG_FILE} is corrupted or empty. A backup will be created, and a fresh configuration will be used.")
-            os.rename(CONFIG_FILE, CONFIG_FILE + ".bak")
+            os.replace(CONFIG_FILE, CONFIG_FILE + ".bak")
             print(f"A backup of the corrupted file was saved as {CONFIG_FILE}.bak")
-            return {}
-    return {}
+            return ConfigStore()
+    return ConfigStore()
 
 # Function to save configuration
 def save_config(config):
-    with open(CONFIG_FILE, "w") as f:
-        json.dump(config, f, indent=4)
+    """Write the configuration if it changed, through a temporary file so a crash never leaves it half written."""
+    if isinstance(config, ConfigStore) and not config.changed and os.path.exists(CONFIG_FILE):
+        debug_log("Configuration unchanged, not saving", DEBUG)
+        return
+
+    temp_file = CONFIG_FILE + ".tmp"
+    try:
+        with open(temp_file, "w") as f:
+            json.dump(config, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, CONFIG_FILE)
+    except OSError as e:
+        print(f"Error saving {CONFIG_FILE}: {e}")
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+        return
+
+    if isinstance(config, ConfigStore):
+        config.changed = False
     debug_log(f"Configuration saved: {config}", DEBUG)
 
 # Function to prompt for a folder and return its path
 def prompt_for_folder(title, initialdir=None):
+    from tkinter import Tk, filedialog
     root = Tk()
     root.withdraw()  # Hide the main tkinter window
     folder_path = filedialog.askdirectory(title=title, initialdir=initialdir)
@@ -141,12 +210,145 @@ def validate_gamesconfig_path(folder):
             return True
     return False
 
+# Install validation: results are cached in the config under "ValidationCache", keyed by path and stored
+# with the path's stat signature (mtime, inode, size). Startup trusts cached results, re-checks every path
+# on a thread pool and only waits for paths it has never seen. Late results update the deactivated buttons.
+# The GamesConfig folder is checked directly instead: it is only a few stats, and every launch that rewrites
+# a game's JSON changes the folder's signature, which would rewrite LauncherConfig.json on the next start.
+VALIDATION_WORKERS = 4
+validation_pool = None
+
+class DaemonThreadPool:
+    """A small thread pool whose workers are daemon threads.
+
+    ThreadPoolExecutor workers are joined when the interpreter exits, so a stat or directory listing stuck
+    on a slow network share or card reader would keep the launcher alive. These workers are simply abandoned.
+    """
+
+    def __init__(self, max_workers, thread_name_prefix):
+        import queue
+        import threading
+        self.tasks = queue.SimpleQueue()
+        self.workers = max_workers
+        for i in range(max_workers):
+            threading.Thread(target=self.work, name=f"{thread_name_prefix}_{i}", daemon=True).start()
+
+    def work(self):
+        while True:
+            task = self.tasks.get()
+            if task is None:
+                return
+            future, function, args = task
+            if not future.set_running_or_notify_cancel():
+                continue  # Cancelled while queued
+            try:
+                future.set_result(function(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+    def submit(self, function, *args):
+        from concurrent.futures import Future
+        future = Future()
+        self.tasks.put((future, function, args))
+        return future
+
+    def shutdown(self):
+        """Let idle workers exit once the queue is drained, without waiting for busy ones."""
+        for _ in range(self.workers):
+            self.tasks.put(None)
+pending_validations = {}  # future -> (config key, path)
+install_status = {}  # config key -> whether its path was valid when last checked
+
+def get_validation_targets(config):
+    """(config key, path, check, cacheable) for every configured path."""
+    targets = []
+    for collection, required_files in KH_REQUIRED_FILES.items():
+        if config.get(collection) not in ["Not Installed", None]:
+            targets.append((collection, config[collection], lambda folder, files=required_files: validate_install_path(folder, files), True))
+    if config.get("HeroicGamesConfig"):
+        targets.append(("HeroicGamesConfig", config["HeroicGamesConfig"], validate_gamesconfig_path, False))
+    if config.get("HeroicPath"):
+        targets.append(("HeroicPath", config["HeroicPath"], os.path.isfile, True))
+    return targets
+
+def check_install_path(path, check, cached):
+    """Validate one path, reusing the cached result while its stat signature is unchanged."""
+    signature = get_file_signature(path)
+    if signature is None:
+        return {"signature": None, "valid": False}
+    if cached is not None and cached["signature"] == list(signature):
+        return cached
+    return {"signature": list(signature), "valid": bool(check(path))}
+
+def start_install_validation(config):
+    """Re-check every configured path in the background, waiting only for those without a cached result."""
+    global validation_pool
+    from concurrent.futures import wait
+
+    if validation_pool is None:
+        validation_pool = DaemonThreadPool(max_workers=VALIDATION_WORKERS, thread_name_prefix="validation")
+
+    cache = config.get("ValidationCache", {})
+    uncached = []
+    for key, path, check, cacheable in get_validation_targets(config):
+        if not cacheable:
+            install_status[key] = bool(check(path))
+            continue
+
+        cached = cache.get(path)
+        future = validation_pool.submit(check_install_path, path, check, cached)
+        pending_validations[future] = (key, path)
+        if cached is None:
+            uncached.append(future)
+        else:
+            install_status[key] = cached["valid"]
+
+    wait(uncached)
+    collect_install_validation(config)
+
+def collect_install_validation(config):
+    """Store finished checks in the config's cache and bring the buttons in line with them."""
+    finished = [future for future in pending_validations if future.done()]
+    if not finished:
+        return
+
+    cache = dict(config.get("ValidationCache", {}))
+    for future in finished:
+        key, path = pending_validations.pop(future)
+        try:
+            result = future.result()
+        except Exception as e:
+            debug_log(f"Error validating {path}: {e}")
+            continue
+        cache[path] = result
+        if config.get(key) != path:
+            continue  # Replaced by a prompt in the meantime
+
+        was_valid = install_status.get(key)
+        install_status[key] = result["valid"]
+        if was_valid is not None and was_valid != result["valid"]:
+            debug_log(f"{key} is now {'valid' if result['valid'] else 'invalid'}: {path}")
+            # Buttons of a collection that came back are no longer deactivated
+            if result["valid"] and key in KH_REQUIRED_FILES:
+                for i, game_info in GAME_CONFIGS.items():
+                    if buttons and game_info["collection"] == key:
+                        buttons[i]["state"] = "INACTIVE"
+    config["ValidationCache"] = cache
+
+    if buttons:
+        apply_deactivated_states(config)
+
+def is_collection_available(config, collection):
+    """A collection can be launched if it is installed and its folder passed validation."""
+    return config.get(collection) != "Not Installed" and install_status.get(collection, True)
+
 # Add to the config validation section near the top
 heroic_default_path = os.path.join(os.getenv('LOCALAPPDATA', ''), 'Programs', 'heroic', 'heroic.exe')
 gamesconfig_default_path = os.path.join(os.getenv('APPDATA', ''), 'heroic', 'GamesConfig')
     
 # Add to the load_config function's validation checks
 def prompt_for_heroic_exe():
+    from tkinter import Tk, filedialog, messagebox
 
     # Existing Windows-specific Heroic exe selection logic
     while True:
@@ -170,7 +372,8 @@ def prompt_for_heroic_exe():
             messagebox.showerror("Invalid File", "Please select the Heroic.exe executable.")
 
 def prompt_for_all_paths():
-    config = {}
+    from tkinter import Tk, messagebox
+    config = ConfigStore()
     kh_titles = {
         "KH1.5+2.5": "KINGDOM HEARTS HD 1.5+2.5 ReMIX",
         "KH2.8": "KINGDOM HEARTS HD 2.8 Final Chapter Prologue",
@@ -213,6 +416,248 @@ def prompt_for_all_paths():
     save_config(config)
     return config
 
+# Install discovery: Heroic's own metadata (the Legendary installed-games list and the GamesConfig files)
+# already knows where the collections are installed, so first-time setup reads it before asking anything
+heroic_config_default_paths = ([os.path.join(os.getenv('APPDATA'), 'heroic')] if os.getenv('APPDATA') else []) + [
+    os.path.join(os.path.expanduser('~'), '.config', 'heroic'),
+    os.path.join(os.path.expanduser('~'), '.var', 'app', 'com.heroicgameslauncher.hgl', 'config', 'heroic')
+]
+
+def read_json_file(path):
+    """Parsed contents of a JSON file, or None if it is missing or unreadable."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def find_collection_folder(collection, candidates):
+    """First candidate folder that holds the collection's required files."""
+    for folder in candidates:
+        if folder and validate_install_path(folder, KH_REQUIRED_FILES[collection]):
+            return folder
+    return None
+
+def discover_installs(heroic_config_dirs=None, heroic_exe_candidates=None):
+    """Fill in what prompt_for_all_paths would ask for from Heroic's metadata.
+
+    Returns a dict with the config keys that could be determined. A collection Heroic's installed list
+    doesn't contain is "Not Installed", one that can't be settled either way is left out. The search
+    locations can be passed in to run against fixture directories.
+    """
+    if heroic_config_dirs is None:
+        heroic_config_dirs = heroic_config_default_paths
+    if heroic_exe_candidates is None:
+        heroic_exe_candidates = [heroic_default_path]
+
+    app_ids = {info["collection"]: os.path.splitext(info["json"])[0] for info in GAME_CONFIGS.values()}
+    discovered = {}
+
+    for heroic_dir in heroic_config_dirs:
+        games_config = os.path.join(heroic_dir, "GamesConfig")
+        if not validate_gamesconfig_path(games_config):
+            continue
+        discovered["HeroicGamesConfig"] = games_config
+
+        installed = read_json_file(os.path.join(heroic_dir, "legendaryConfig", "legendary", "installed.json"))
+        for collection, app_id in app_ids.items():
+            # Where Legendary installed it, then the folder the current targetExe sits in
+            candidates = []
+            if isinstance(installed, dict) and isinstance(installed.get(app_id), dict):
+                candidates.append(installed[app_id].get("install_path"))
+
+            game_config = read_json_file(os.path.join(games_config, app_id + ".json"))
+            target_exe = ((game_config or {}).get(app_id) or {}).get("targetExe")
+            if isinstance(target_exe, str):
+                target_exe = target_exe.replace("\\", "/")
+                for required_file in KH_REQUIRED_FILES[collection]:
+                    if target_exe.endswith("/" + required_file):
+                        candidates.append(target_exe[:-len(required_file) - 1])
+
+            folder = find_collection_folder(collection, candidates)
+            if folder is not None:
+                discovered[collection] = folder
+            elif isinstance(installed, dict) and app_id not in installed:
+                discovered[collection] = "Not Installed"
+        break
+
+    for heroic_exe in heroic_exe_candidates:
+        if os.path.isfile(heroic_exe):
+            discovered["HeroicPath"] = heroic_exe
+            break
+
+    debug_log(f"Discovered installs: {discovered}", DEBUG)
+    return discovered
+
+# Install scanner: when Heroic's metadata doesn't settle a collection, likely library folders are searched
+# breadth-first to a bounded depth for its required files, before falling back to the folder dialogs
+SCAN_MAX_DEPTH = 5  # Folder levels below each root
+SCAN_WORKERS = 8
+SCAN_TIME_LIMIT = 30.0  # Seconds before the scan gives up on what it hasn't found
+SCAN_PROGRESS_INTERVAL = 0.2  # Seconds between progress updates
+SCAN_SKIP_DIRS = {"windows", "$recycle.bin", "system volume information", "programdata", "appdata",
+                  "proc", "sys", "dev", "node_modules", "__pycache__"}
+
+def get_scan_roots():
+    """Folders a KH install is likely to be under: game library folders, home and mounted drives."""
+    home = os.path.expanduser("~")
+    roots = [os.path.join(home, "Games"), home]
+    if os.name == "nt":
+        import string
+        for letter in string.ascii_uppercase:
+            drive = f"{letter}:\\"
+            if os.path.exists(drive):
+                roots += [os.path.join(drive, "Program Files", "Epic Games"), os.path.join(drive, "Games"), drive]
+    else:
+        roots += ["/mnt", "/media", "/run/media"]
+    return [root for root in roots if os.path.isdir(root)]
+
+def list_scan_directory(path):
+    """Entry names of a directory, and the subdirectories worth descending into."""
+    names = set()
+    subdirs = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                names.add(entry.name)
+                if entry.name.startswith(".") or entry.name.lower() in SCAN_SKIP_DIRS:
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                except OSError:
+                    pass
+    except OSError:
+        pass  # Unreadable folders are simply not searched
+    return names, subdirs
+
+def scan_for_installs(collections, roots=None, max_depth=SCAN_MAX_DEPTH, cancel_event=None, show_progress=True,
+                      on_progress=None):
+    """Search the roots for folders holding each collection's required files.
+
+    Directories are listed on a thread pool, breadth-first, and the scan stops as soon as every collection
+    was found, cancel_event is set, SCAN_TIME_LIMIT passes or Ctrl+C is pressed. Progress is printed, and
+    passed to on_progress(folders scanned, collections found) if given. Returns {collection: folder}.
+    """
+    import threading
+    from concurrent.futures import wait, FIRST_COMPLETED
+
+    if roots is None:
+        roots = get_scan_roots()
+    if cancel_event is None:
+        cancel_event = threading.Event()
+
+    # A folder is only validated once it contains the first path component of every required file
+    markers = {collection: {file.split("/")[0] for file in KH_REQUIRED_FILES[collection]} for collection in collections}
+    remaining = list(collections)
+    found = {}
+    seen = set()
+    scanned = 0
+    started = last_progress = time.time()
+
+    pool = DaemonThreadPool(max_workers=SCAN_WORKERS, thread_name_prefix="install-scan")
+    pending = {}
+
+    def submit(path, depth):
+        key = os.path.normcase(os.path.abspath(path))
+        if key not in seen:
+            seen.add(key)
+            pending[pool.submit(list_scan_directory, path)] = (path, depth)
+
+    try:
+        for root in roots:
+            submit(root, 0)
+
+        while pending and remaining and not cancel_event.is_set():
+            done, _ = wait(pending, timeout=SCAN_PROGRESS_INTERVAL, return_when=FIRST_COMPLETED)
+            for future in done:
+                path, depth = pending.pop(future)
+                names, subdirs = future.result()
+                scanned += 1
+
+                for collection in list(remaining):
+                    if markers[collection] <= names and validate_install_path(path, KH_REQUIRED_FILES[collection]):
+                        found[collection] = path
+                        remaining.remove(collection)
+                        debug_log(f"Scanner found {collection} at {path}", DEBUG)
+
+                if depth < max_depth:
+                    for subdir in subdirs:
+                        submit(subdir, depth + 1)
+
+            now = time.time()
+            if now - started > SCAN_TIME_LIMIT:
+                debug_log("Install scan timed out", DEBUG)
+                cancel_event.set()
+            if now - last_progress >= SCAN_PROGRESS_INTERVAL:
+                if show_progress:
+                    print(f"\rSearching for installs: {scanned} folders, {len(found)} of {len(collections)} found", end="", flush=True)
+                if on_progress is not None:
+                    on_progress(scanned, len(found))
+                last_progress = now
+    except KeyboardInterrupt:
+        cancel_event.set()
+    finally:
+        # Listings stuck on a stalled drive are left to finish on their own
+        for future in pending:
+            future.cancel()
+        pool.shutdown()
+
+    if show_progress:
+        print(f"\rSearching for installs: {scanned} folders, {len(found)} of {len(collections)} found in {time.time() - started:.1f}s")
+    return found
+
+def scan_for_installs_with_window(collections):
+    """Run the install scan behind a small progress window whose Cancel button stops it."""
+    import threading
+    import tkinter
+    from tkinter import ttk
+
+    try:
+        root = tkinter.Tk()
+    except tkinter.TclError as e:
+        # No display to show the window on, the console progress and Ctrl+C still work
+        debug_log(f"Install scan window unavailable: {e}", DEBUG)
+        return scan_for_installs(collections)
+
+    cancel_event = threading.Event()
+    progress = {"scanned": 0, "found": 0}
+    found = {}
+
+    def run_scan():
+        found.update(scan_for_installs(collections, cancel_event=cancel_event, show_progress=False,
+                                       on_progress=lambda scanned, found_count: progress.update(scanned=scanned, found=found_count)))
+
+    root.title("KINGDOM HEARTS Omni Lite Launcher")
+    root.resizable(False, False)
+    status = ttk.Label(root, text="Searching for KINGDOM HEARTS installs...", width=50)
+    status.pack(padx=16, pady=(16, 8))
+    bar = ttk.Progressbar(root, mode="indeterminate", length=340)
+    bar.pack(padx=16)
+    bar.start(15)
+    ttk.Button(root, text="Cancel", command=cancel_event.set).pack(pady=12)
+    root.protocol("WM_DELETE_WINDOW", cancel_event.set)
+    root.eval("tk::PlaceWindow . center")
+
+    scan_thread = threading.Thread(target=run_scan, daemon=True)
+    scan_thread.start()
+
+    # Widgets are only touched from this thread, the scan just leaves its numbers in progress
+    def poll_scan():
+        if not scan_thread.is_alive():
+            root.destroy()
+            return
+        if cancel_event.is_set():
+            status.config(text="Cancelling...")
+        else:
+            status.config(text=f"Searched {progress['scanned']} folders, found {progress['found']} of {len(collections)}")
+        root.after(100, poll_scan)
+
+    root.after(100, poll_scan)
+    root.mainloop()
+    scan_thread.join()
+    return found
+
 def handle_launch_arguments(config):
     """
     Parse launch arguments and potentially launch a specific game.
@@ -248,9 +693,8 @@ def handle_launch_arguments(config):
             print(f"Error: {collection} is not installed.")
             return False
         
-        # Attempt to launch the game
+        # Attempt to launch the game (pygame was never started on this path)
         if launch_game(config, game_index):
-            pygame.quit()
             sys.exit()
         else:
             print(f"Failed to launch game for argument: {game_arg}")
@@ -258,15 +702,154 @@ def handle_launch_arguments(config):
     
     return False
 
+# Sound bank: every UI sound is decoded once at startup and played on a small channel pool
+SOUND_FILES = ["select.wav", "confirm.wav", "open.wav", "close.wav", "denied.wav"]
+SOUND_CHANNELS = 8
+MIXER_FREQUENCY = 44100
+MIXER_BUFFER_SIZE = 512  # Samples per mixer buffer, kept small for low latency
+sound_bank = {}
+
+def load_sound_bank():
+    """Decode every UI sound once and reserve the mixer channels they play on."""
+    if not pygame.mixer.get_init():
+        print("Warning: Audio is unavailable, launcher sounds are disabled.")
+        return
+
+    pygame.mixer.set_num_channels(SOUND_CHANNELS)
+    for sound_file in SOUND_FILES:
+        try:
+            sound_bank[sound_file] = load_sound(os.path.join(os.path.dirname(__file__), sound_file))
+        except Exception as e:
+            print(f"Error loading sound {sound_file}: {e}")
+
 # Function to play sound
 def play_sound(sound_file):
     try:
-        sound_path = os.path.join(os.path.dirname(__file__), sound_file)
-        pygame.mixer.music.load(sound_path)
-        pygame.mixer.music.play()
+        sound = sound_bank.get(sound_file)
+        if sound is None:
+            return
+        # Sounds overlap instead of cutting each other off; the oldest one is stopped if every channel is busy
+        pygame.mixer.find_channel(True).play(sound)
     except Exception as e:
         print(f"Error playing sound: {e}")
 
+# Asset bundle: every launcher image and sound packed into one memory-mapped file, stored as
+# raw pixels and ready-to-play PCM so nothing has to be decoded at startup. Build it with:
+#   python "KINGDOM HEARTS Omni Lite Launcher.py" --build-bundle
+ASSET_BUNDLE_FILE = os.path.join(os.path.dirname(__file__), "LauncherAssets.bundle")
+ASSET_BUNDLE_MAGIC = b"KHOLBNDL"
+ASSET_BUNDLE_VERSION = 1
+ASSET_BUNDLE_MTIME_TOLERANCE = 2.0  # Seconds, zip archives only keep mtimes to 2 second precision
+asset_bundle = None  # {"buffer": memoryview of the mapped file, "assets": {file name: entry}, "mixer": [...]}
+
+def get_asset_signature(path):
+    """Size and modification time of a loose asset file, or None if it is missing."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime]
+
+def build_asset_bundle():
+    """Pack every launcher PNG and WAV into ASSET_BUNDLE_FILE."""
+    import struct
+    asset_dir = os.path.dirname(os.path.abspath(__file__))
+    asset_files = sorted(name for name in os.listdir(asset_dir) if name.lower().endswith((".png", ".wav")))
+
+    header = {"version": ASSET_BUNDLE_VERSION, "mixer": pygame.mixer.get_init(), "assets": {}}
+    blobs = []
+    offset = 0
+    for name in asset_files:
+        path = os.path.join(asset_dir, name)
+        if name.lower().endswith(".png"):
+            image = pygame.image.load(path)
+            alpha = bool(image.get_flags() & pygame.SRCALPHA)
+            pixel_format = "RGBA" if alpha else "RGB"
+            data = pygame.image.tobytes(image, pixel_format)
+            entry = {"kind": "image", "size": list(image.get_size()), "alpha": alpha, "format": pixel_format}
+        else:
+            if not pygame.mixer.get_init():
+                print(f"Warning: Audio is unavailable, {name} will be loaded from disk.")
+                continue
+            data = pygame.mixer.Sound(path).get_raw()
+            entry = {"kind": "sound"}
+
+        entry.update({"offset": offset, "length": len(data), "source": get_asset_signature(path)})
+        header["assets"][name] = entry
+        blobs.append(data)
+        offset += len(data)
+
+    header_bytes = json.dumps(header).encode("utf-8")
+    temp_file = ASSET_BUNDLE_FILE + ".tmp"
+    with open(temp_file, "wb") as f:
+        f.write(ASSET_BUNDLE_MAGIC)
+        f.write(struct.pack("<II", ASSET_BUNDLE_VERSION, len(header_bytes)))
+        f.write(header_bytes)
+        for data in blobs:
+            f.write(data)
+    os.replace(temp_file, ASSET_BUNDLE_FILE)
+    print(f"Asset bundle written to {ASSET_BUNDLE_FILE} ({len(header['assets'])} assets, {offset} bytes)")
+
+def open_asset_bundle():
+    """Memory-map ASSET_BUNDLE_FILE, ignoring it if it is missing, damaged or older than the loose files."""
+    global asset_bundle
+    import mmap
+    import struct
+    if not os.path.exists(ASSET_BUNDLE_FILE):
+        debug_log("No asset bundle found, loading loose asset files.")
+        return
+
+    try:
+        with open(ASSET_BUNDLE_FILE, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        prefix = len(ASSET_BUNDLE_MAGIC) + 8
+        version, header_length = struct.unpack("<II", mapped[len(ASSET_BUNDLE_MAGIC):prefix])
+        if mapped[:len(ASSET_BUNDLE_MAGIC)] != ASSET_BUNDLE_MAGIC or version != ASSET_BUNDLE_VERSION:
+            print(f"Warning: {ASSET_BUNDLE_FILE} is from another launcher version and will be ignored.")
+            return
+        header = json.loads(mapped[prefix:prefix + header_length].decode("utf-8"))
+    except (OSError, ValueError, struct.error) as e:
+        print(f"Warning: {ASSET_BUNDLE_FILE} could not be read and will be ignored: {e}")
+        return
+
+    # A loose file that changed since the bundle was built makes the whole bundle stale
+    asset_dir = os.path.dirname(os.path.abspath(__file__))
+    for name, entry in header["assets"].items():
+        signature = get_asset_signature(os.path.join(asset_dir, name))
+        if signature is not None and (
+            signature[0] != entry["source"][0] or abs(signature[1] - entry["source"][1]) > ASSET_BUNDLE_MTIME_TOLERANCE
+        ):
+            print(f"Warning: {ASSET_BUNDLE_FILE} is out of date ({name} changed). Rebuild it with --build-bundle.")
+            return
+
+    data = memoryview(mapped)[prefix + header_length:]
+    asset_bundle = {"buffer": data, "assets": header["assets"], "mixer": header["mixer"]}
+    debug_log(f"Asset bundle mapped: {len(header['assets'])} assets")
+
+def get_bundle_entry(path, kind):
+    """Return (entry, data) for an asset stored in the bundle, or None to load the loose file."""
+    if asset_bundle is None:
+        return None
+    entry = asset_bundle["assets"].get(os.path.basename(path))
+    if entry is None or entry["kind"] != kind:
+        return None
+    return entry, asset_bundle["buffer"][entry["offset"]:entry["offset"] + entry["length"]]
+
+def load_image(image_path):
+    """Load an image from the asset bundle if possible, decoding the loose file otherwise."""
+    bundled = get_bundle_entry(image_path, "image")
+    if bundled is None:
+        return pygame.image.load(image_path)
+    entry, data = bundled
+    return pygame.image.frombuffer(data, tuple(entry["size"]), entry["format"])
+
+def load_sound(sound_path):
+    """Load a sound from the asset bundle if its PCM matches the mixer, decoding the loose file otherwise."""
+    bundled = get_bundle_entry(sound_path, "sound")
+    if bundled is None or tuple(asset_bundle["mixer"] or ()) != pygame.mixer.get_init():
+        return pygame.mixer.Sound(sound_path)
+    return pygame.mixer.Sound(buffer=bundled[1])
+
 # Debugging Function
 def debug_log(message, debug=False):
     if DEBUG:
@@ -275,6 +858,7 @@ def debug_log(message, debug=False):
 # DPI Detection for Windows
 def get_system_dpi():
     try:
+        import ctypes
         ctypes.windll.shcore.SetProcessDpiAwareness(2)
         hdc = ctypes.windll.user32.GetDC(0)
         dpi = ctypes.windll.gdi32.GetDeviceCaps(hdc, 88)
@@ -296,61 +880,83 @@ def toggle_fullscreen():
     else:
         # Return to a predefined windowed resolution
         screen = pygame.display.set_mode((logical_width, logical_height), pygame.RESIZABLE | pygame.DOUBLEBUF)
-    
-    return screen
 
-# Detect DPI scaling
-DPI_SCALING = get_system_dpi()
-
-# Initialize Pygame
-pygame.init()
-
-# Set the application icon
-icon_path = os.path.join(os.path.dirname(__file__), "heart.png")
-icon = pygame.image.load(icon_path)
-icon = pygame.transform.smoothscale(icon, (96, 96))
-pygame.display.set_icon(icon)
-
-# Initialize Pygame Joystick Support
-pygame.joystick.init()
-
-# Check joystick initialization and button press
-if pygame.joystick.get_count() > 0:
-    controller = pygame.joystick.Joystick(0)
-    controller.init()
-    debug_log("Controller initialized.")
-else:
-    controller = None
-    debug_log("No controller detected.")
-
-# Setup Display
-flags = pygame.RESIZABLE | pygame.DOUBLEBUF
-default_width = int(1280 / DPI_SCALING)
-default_height = int(720 / DPI_SCALING)
-screen = pygame.display.set_mode((default_width, default_height), flags)
-fullscreen = "-f" in sys.argv  # Set fullscreen based on launch argument
+    rebuild_layout()
+    return screen
 
-# Initialize display mode
-flags = pygame.DOUBLEBUF
+# Display state, set up by init_display()
+DPI_SCALING = 1.0
 screen = None
-if fullscreen:
-    screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN | flags)
-else:
-    screen = pygame.display.set_mode((default_width, default_height), flags)
+clock = None  # Clock for FPS management
+controller = None
+fullscreen = "-f" in sys.argv  # Set fullscreen based on launch argument
 
 # Setup Display - Override DPI scaling by manually controlling the window size
 # Let's set the window size explicitly based on logical resolution and disable DPI scaling
 logical_width, logical_height = 1280, 720  # Logical resolution we want to work with
 
-if fullscreen:
-    screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN | flags)
-else:
-    screen = pygame.display.set_mode((logical_width, logical_height), pygame.RESIZABLE | flags)
+def init_display():
+    """Set up pygame, the window, controller, sounds and artwork. Shortcut launches never call this."""
+    global DPI_SCALING, clock, controller
+
+    # Detect DPI scaling
+    DPI_SCALING = get_system_dpi()
+
+    # Initialize Pygame
+    init_pygame()
+
+    # Map the asset bundle before anything is loaded
+    open_asset_bundle()
+
+    # Set the application icon
+    icon_path = os.path.join(os.path.dirname(__file__), "heart.png")
+    icon = load_image(icon_path)
+    icon = pygame.transform.smoothscale(icon, (96, 96))
+    pygame.display.set_icon(icon)
+
+    # Initialize Pygame Joystick Support
+    pygame.joystick.init()
+
+    # Check joystick initialization and button press
+    if pygame.joystick.get_count() > 0:
+        controller = pygame.joystick.Joystick(0)
+        controller.init()
+        debug_log("Controller initialized.")
+    else:
+        controller = None
+        debug_log("No controller detected.")
+
+    open_window()
+    pygame.display.set_caption("KINGDOM HEARTS Omni Lite Launcher")
+
+    clock = pygame.time.Clock()
+
+    create_buttons()
+    load_launcher_artwork()
+    load_sound_bank()
+
+def open_window():
+    """Create (or re-create) the launcher window in the current fullscreen mode."""
+    global screen
+    # Initialize display mode
+    flags = pygame.DOUBLEBUF
+    if fullscreen:
+        screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN | flags)
+    else:
+        screen = pygame.display.set_mode((logical_width, logical_height), pygame.RESIZABLE | flags)
 
-pygame.display.set_caption("KINGDOM HEARTS Omni Lite Launcher")
+def load_launcher_artwork():
+    """Load the backgrounds, logos and confirm dialog images the menu draws from."""
+    global background, logo, shown_artwork_index
 
-# Clock for FPS management
-clock = pygame.time.Clock()
+    # Decode everything in the background, waiting only for the first selection's artwork
+    start_artwork_decode()
+    collect_decoded_artwork(wait_for_index=background_index)
+    background = decoded_backgrounds[background_index]
+    logo = decoded_logos[logo_index]
+    shown_artwork_index = background_index
+
+    load_confirm_images()
 
 # Title Images
 TITLE_IMAGES = [
@@ -365,7 +971,6 @@ BG_IMAGES = [
     os.path.join(os.path.dirname(__file__), "bbs-bg.png"), os.path.join(os.path.dirname(__file__), "ddd-bg.png"), os.path.join(os.path.dirname(__file__), "afp-bg.png"), os.path.join(os.path.dirname(__file__), "kh3-bg.png")
 ]
 background_index = 0
-background = pygame.image.load(BG_IMAGES[background_index]).convert()
 
 # Logo Image
 logo_index = 0
@@ -373,16 +978,103 @@ LOGO_IMAGES = [
     os.path.join(os.path.dirname(__file__), "kh1-logo.png"), os.path.join(os.path.dirname(__file__), "com-logo.png"), os.path.join(os.path.dirname(__file__), "kh2-logo.png"),
     os.path.join(os.path.dirname(__file__), "bbs-logo.png"), os.path.join(os.path.dirname(__file__), "ddd-logo.png"), os.path.join(os.path.dirname(__file__), "afp-logo.png"), os.path.join(os.path.dirname(__file__), "kh3-logo.png")
 ]
-logo = pygame.image.load(LOGO_IMAGES[logo_index]).convert_alpha()  # Load the logo with transparency
-logo_rect = logo.get_rect()
 
-# Starting position for the logo (relative percentage coordinates)
-logo_x = int(screen.get_width() * 0.3932)  # 39.32% of the screen width
-logo_y = int(screen.get_height() * 0.1935)  # 19.35% of the screen height
-logo_rect.topleft = (logo_x, logo_y)
+# Background/logo decoding runs on a worker pool at startup; the render thread only converts
+# finished images and swaps them in, so changing the selection never touches the disk
+ARTWORK_DECODE_WORKERS = 4
+artwork_pool = None
+pending_artwork = {}  # Future -> ("background" or "logo", index)
+decoded_backgrounds = {}
+decoded_logos = {}
+scaled_backgrounds = {}  # Index -> background scaled to scaled_backgrounds_size
+scaled_backgrounds_size = None
+shown_artwork_index = None  # Index of the background/logo currently on screen
+background = None
+logo = None
+
+def start_artwork_decode():
+    """Queue every background and logo for decoding on the worker pool."""
+    global artwork_pool
+    from concurrent.futures import ThreadPoolExecutor
+    artwork_pool = ThreadPoolExecutor(max_workers=ARTWORK_DECODE_WORKERS)
+    for i in range(len(BG_IMAGES)):
+        pending_artwork[artwork_pool.submit(load_image, BG_IMAGES[i])] = ("background", i)
+        pending_artwork[artwork_pool.submit(load_image, LOGO_IMAGES[i])] = ("logo", i)
+    artwork_pool.shutdown(wait=False)
+
+def collect_decoded_artwork(wait_for_index=None):
+    """Convert decoded images on the render thread. Blocks only for the artwork of wait_for_index."""
+    for future, (kind, index) in list(pending_artwork.items()):
+        if not future.done() and index != wait_for_index:
+            continue
+        del pending_artwork[future]
+        try:
+            if kind == "background":
+                decoded_backgrounds[index] = future.result().convert()
+            else:
+                decoded_logos[index] = future.result().convert_alpha()  # Keep the logo's transparency
+            debug_log(f"Decoded {kind} {index}")
+        except Exception as e:
+            print(f"Error loading {kind} image {index}: {e}")
+
+def get_scaled_background(index, window_width, window_height):
+    """Return the background for index scaled to the window, scaling it only once per window size."""
+    global scaled_backgrounds_size
+    if scaled_backgrounds_size != (window_width, window_height):
+        scaled_backgrounds.clear()
+        scaled_backgrounds_size = (window_width, window_height)
+    if index not in scaled_backgrounds:
+        scaled_backgrounds[index] = update_background(window_width, window_height, decoded_backgrounds[index])
+    return scaled_backgrounds[index]
+
+def prescale_next_background(window_width, window_height):
+    """Scale one decoded background that is not ready for this window size yet (one per frame)."""
+    for index in decoded_backgrounds:
+        if scaled_backgrounds_size != (window_width, window_height) or index not in scaled_backgrounds:
+            get_scaled_background(index, window_width, window_height)
+            return
+
+def show_selected_artwork():
+    """Swap in the background and logo for the current selection once they are decoded."""
+    global background, scaled_background, logo, shown_artwork_index
+    if shown_artwork_index == background_index:
+        return
+    if background_index not in decoded_backgrounds or logo_index not in decoded_logos:
+        return  # Still decoding, keep the previous artwork on screen for now
+
+    background = decoded_backgrounds[background_index]
+    logo = decoded_logos[logo_index]
+    window_width, window_height = screen.get_size()
+    scaled_background = get_scaled_background(background_index, window_width, window_height)
+    shown_artwork_index = background_index
+    request_full_redraw()
+    debug_log(f"Logo changed to {LOGO_IMAGES[logo_index]}")
+    debug_log(f"Background changed to {BG_IMAGES[background_index]}")
+
+# Resting position for the logo (relative percentage coordinates)
+LOGO_ANCHOR = (0.3932, 0.1935)  # 39.32% of the canvas width, 19.35% of the canvas height
+
+# Logos scaled for the current canvas, keyed by (logo_index, canvas size)
+scaled_logos = {}
+
+def get_scaled_logo(index, canvas_size):
+    """Return the logo for index scaled to the canvas, scaling it only once per canvas size."""
+    key = (index, canvas_size)
+    scaled_logo = scaled_logos.get(key)
+    if scaled_logo is None:
+        # Logos for other canvas sizes are stale now
+        for stale_key in [k for k in scaled_logos if k[1] != canvas_size]:
+            del scaled_logos[stale_key]
+        scale_factor = canvas_size[0] / ASSET_RESOLUTION[0]
+        source = decoded_logos[index]
+        scaled_logo = pygame.transform.smoothscale(
+            source, (int(source.get_width() * scale_factor), int(source.get_height() * scale_factor))
+        )
+        scaled_logos[key] = scaled_logo
+    return scaled_logo
 
 # Floating Parameters
-FLOAT_AMPLITUDE = 0.01  # Percent of the canvas height
+FLOAT_AMPLITUDE = 0.02  # Percent of the canvas height
 FLOAT_SPEED = 2.0  # Speed of the sine wave (higher = faster)
 start_time = time.time()  # Track the starting time
 
@@ -394,6 +1086,15 @@ BUTTON_STATES = {
     "ACTIVE": os.path.join(os.path.dirname(__file__), "button-1.png"),
     "DEACTIVATED": os.path.join(os.path.dirname(__file__), "button-2.png")
 }
+
+# Title shown on DEACTIVATED buttons
+NO_TITLE_IMAGE = os.path.join(os.path.dirname(__file__), "no-title.png")
+
+# Hover overlays (button-3 over ACTIVE buttons, button-3b over everything else)
+HOVER_IMAGES = {
+    "ACTIVE": os.path.join(os.path.dirname(__file__), "button-3.png"),
+    "DEFAULT": os.path.join(os.path.dirname(__file__), "button-3b.png")
+}
         
 NUM_BUTTONS = 7
 buttons = []
@@ -403,16 +1104,13 @@ pressed_button_index = None  # Track the currently pressed button
 pressed_button_time = 0  # Time when the button was pressed
 button_press_duration = 200  # Time for the pressed state animation
 
-load_confirm_images()
-
-# Initialize the button rects with placeholder dimensions, INACTIVE state, and hovered_flag
-for i in range(NUM_BUTTONS):
-    button_rect = pygame.Rect(0, 0, 500, 122)  # Placeholder rect, will be scaled
-    buttons.append({
-        "state": "INACTIVE",
-        "rect": button_rect,
-        "hovered_flag": False  # Ensure the hovered_flag key is initialized
-    })
+def create_buttons():
+    """Initialize the buttons with INACTIVE state and hovered_flag. Their geometry lives in the layout."""
+    for i in range(NUM_BUTTONS):
+        buttons.append({
+            "state": "INACTIVE",
+            "hovered_flag": False  # Ensure the hovered_flag key is initialized
+        })
 
 # Helper Functions
 def calculate_canvas_fit(window_width, window_height):
@@ -433,8 +1131,8 @@ def calculate_canvas_fit(window_width, window_height):
         canvas_height
     )
 
-def update_background(window_width, window_height):
-    """Re-scale the background while maintaining 16:9 aspect ratio."""
+def update_background(window_width, window_height, image=None):
+    """Re-scale the background (or the given image) while maintaining 16:9 aspect ratio."""
     # Calculate the scaled background
     target_aspect = 16 / 9
     window_aspect = window_width / window_height
@@ -447,7 +1145,104 @@ def update_background(window_width, window_height):
         new_height = int(new_width / target_aspect)
 
     # Scale the background image to the new size
-    return pygame.transform.smoothscale(background, (new_width, new_height))
+    return pygame.transform.smoothscale(background if image is None else image, (new_width, new_height))
+
+# Dirty-rectangle rendering: only regions that changed since the last frame are pushed to the display.
+# Resizes, fullscreen toggles and background changes fall back to a full redraw.
+DIRTY_RECT_RENDERING = True
+dirty_rects = []  # Canvas-space rects changed this frame
+full_redraw = True
+drawn_logo_rect = None
+
+def mark_dirty(rect):
+    """Queue a canvas-space region to be pushed to the display this frame."""
+    dirty_rects.append(pygame.Rect(rect))
+
+def request_full_redraw():
+    """Push the whole window on the next frame."""
+    global full_redraw
+    full_redraw = True
+
+def mark_logo_dirty(logo_rect):
+    """Mark the area the floating logo left and the area it now covers."""
+    global drawn_logo_rect
+    if drawn_logo_rect is not None and drawn_logo_rect != logo_rect:
+        mark_dirty(drawn_logo_rect.union(logo_rect))
+    elif drawn_logo_rect is None:
+        mark_dirty(logo_rect)
+    drawn_logo_rect = logo_rect
+
+def get_redraw_regions(canvas):
+    """Return the canvas regions to redraw this frame, merging the ones that overlap."""
+    if full_redraw or not DIRTY_RECT_RENDERING:
+        return [canvas.get_rect()]
+
+    regions = []
+    for rect in dirty_rects:
+        rect = rect.clip(canvas.get_rect())
+        if not (rect.width and rect.height):
+            continue
+        # Fold every region this one overlaps into it
+        overlapping = rect.collidelistall(regions)
+        for index in reversed(overlapping):
+            rect.union_ip(regions.pop(index))
+        regions.append(rect)
+    return regions
+
+def present_canvas(canvas, canvas_rect, regions):
+    """Copy the redrawn canvas regions to the screen, flipping the whole window on a full redraw."""
+    global full_redraw
+    if full_redraw or not DIRTY_RECT_RENDERING:
+        phase_started = time.perf_counter()
+        screen.fill(BLACK)
+        screen.blit(canvas, canvas_rect.topleft)
+        profile_phase("blits", phase_started)
+        phase_started = time.perf_counter()
+        pygame.display.flip()
+        profile_phase("flip", phase_started)
+    elif regions:
+        phase_started = time.perf_counter()
+        screen_rects = []
+        for rect in regions:
+            screen_rects.append(screen.blit(canvas, rect.move(canvas_rect.topleft), area=rect))
+        profile_phase("blits", phase_started)
+        phase_started = time.perf_counter()
+        pygame.display.update(screen_rects)
+        profile_phase("flip", phase_started)
+
+    dirty_rects.clear()
+    full_redraw = False
+
+# Sprite cache: each image file is decoded once, scaled copies are kept per (asset, width, height)
+sprite_sources = {}
+scaled_sprites = {}
+scaled_sprites_canvas_size = None
+
+def load_sprite(image_path):
+    """Decode an image file once and keep the converted surface for the rest of the session."""
+    sprite = sprite_sources.get(image_path)
+    if sprite is None:
+        sprite = load_image(image_path).convert_alpha()
+        sprite_sources[image_path] = sprite
+        debug_log(f"Sprite decoded: {image_path}")
+    return sprite
+
+def get_scaled_sprite(image_path, width, height):
+    """Return a copy of the sprite scaled to (width, height), scaling it only the first time."""
+    key = (image_path, width, height)
+    scaled = scaled_sprites.get(key)
+    if scaled is None:
+        scaled = pygame.transform.smoothscale(load_sprite(image_path), (width, height))
+        scaled_sprites[key] = scaled
+    return scaled
+
+def invalidate_scaled_sprites(canvas_size):
+    """Drop every scaled sprite when the canvas changes size."""
+    global scaled_sprites_canvas_size
+    if canvas_size != scaled_sprites_canvas_size:
+        scaled_sprites.clear()
+        scaled_sprites_canvas_size = canvas_size
+        debug_log(f"Scaled sprite cache cleared for canvas size {canvas_size}")
 
 # Global flag to track active input mode (controller, mouse or keyboard)
 active_input = "controller"  # Can be "controller", "mouse" or "keyboard"
@@ -530,8 +1325,8 @@ def handle_keyboard_navigation(event):
     if CONFIRM_STATE != ConfirmState.CLOSED:
         return
     
-    if event.key in [K_UP, K_DOWN]:
-        direction = -1 if event.key == K_UP else 1
+    if event.key in [pygame.K_UP, pygame.K_DOWN]:
+        direction = -1 if event.key == pygame.K_UP else 1
         original_index = selected_button_index
         
         # Keep trying next button until we find a non-DEACTIVATED one or complete a full cycle
@@ -557,8 +1352,8 @@ def handle_keyboard_navigation(event):
         else:
             button["hovered_flag"] = False
 
-    if event.type == KEYDOWN:
-        if event.key == K_SPACE:
+    if event.type == pygame.KEYDOWN:
+        if event.key == pygame.K_SPACE:
             if buttons[selected_button_index]["state"] in ["HOVERED", "ACTIVE"]:
                 activate_button(selected_button_index)
             
@@ -574,34 +1369,27 @@ def handle_mouse_navigation(event):
         return
 
     if active_input == "mouse":
-        # Map mouse position to canvas coordinates
-        mouse_x, mouse_y = event.pos
-        canvas_mouse_x = mouse_x - canvas_rect.x
-        canvas_mouse_y = mouse_y - canvas_rect.y
+        hovered_index = layout.button_at(event.pos)
 
-        hovered_any = False
         for i, button in enumerate(buttons):
-            if button["rect"].collidepoint((canvas_mouse_x, canvas_mouse_y)):
-                if button["state"] != "DEACTIVATED":  # Only allow hovering non-DEACTIVATED buttons
-                    hovered_any = True
-                    if not button["hovered_flag"]:
-                        button["hovered_flag"] = True
-                        debug_log(f"Mouse hovered over button {i}")
-
-                    # Play sound if a new button is hovered over
-                    if last_hovered_button_index != i:
-                        play_sound("select.wav")
-                        last_hovered_button_index = i
-
-                    selected_button_index = i
-            else:
-                if button["state"] != "DEACTIVATED":  # Only modify non-DEACTIVATED buttons
-                    button["hovered_flag"] = False
+            if i != hovered_index and button["state"] != "DEACTIVATED":  # Only modify non-DEACTIVATED buttons
+                button["hovered_flag"] = False
 
         # If no button was hovered, do not change the selected index
-        if not hovered_any:
+        if hovered_index is None or buttons[hovered_index]["state"] == "DEACTIVATED":
             return
 
+        if not buttons[hovered_index]["hovered_flag"]:
+            buttons[hovered_index]["hovered_flag"] = True
+            debug_log(f"Mouse hovered over button {hovered_index}")
+
+        # Play sound if a new button is hovered over
+        if last_hovered_button_index != hovered_index:
+            play_sound("select.wav")
+            last_hovered_button_index = hovered_index
+
+        selected_button_index = hovered_index
+
 def handle_mouse_selection(event):
     global active_input, selected_button_index
 
@@ -610,35 +1398,29 @@ def handle_mouse_selection(event):
         return
 
     if active_input == "mouse":
-        mouse_x, mouse_y = event.pos
-        canvas_mouse_x = mouse_x - canvas_rect.x
-        canvas_mouse_y = mouse_y - canvas_rect.y
+        clicked_index = layout.button_at(event.pos)
 
-        button_clicked = False
-        for i, button in enumerate(buttons):
-            if button["rect"].collidepoint((canvas_mouse_x, canvas_mouse_y)):
-                button_clicked = True
-                if button["state"] == "DEACTIVATED":
-                    play_sound("denied.wav")
-                    return
-                elif button["state"] in ["HOVERED", "ACTIVE"]:  # Allow ACTIVE buttons to be pressed
-                    activate_button(i)
-                    break
-        
         # Only update states if a button was actually clicked
-        if button_clicked:
-            update_button_states(selected_button_index)
+        if clicked_index is None:
+            return
+
+        if buttons[clicked_index]["state"] == "DEACTIVATED":
+            play_sound("denied.wav")
+            return
+        elif buttons[clicked_index]["state"] in ["HOVERED", "ACTIVE"]:  # Allow ACTIVE buttons to be pressed
+            activate_button(clicked_index)
+
+        update_button_states(selected_button_index)
 
 # Add a variable to track the last selected button
 last_selected_button_index = None 
 # Add a variable to track the last state of each button
-last_button_state = [None] * len(buttons)  # None means no state has been set yet
+last_button_state = [None] * NUM_BUTTONS  # None means no state has been set yet
 
 # Update the button states function to handle initialization
 def update_button_states(selected_index):
     global active_button_index, pressed_button_index, last_button_state
-    global background_index, background, scaled_background
-    global logo_index, logo
+    global background_index, logo_index
 
     # Only update if the selected index is different from the current background/logo index
     if selected_index == background_index and selected_index == logo_index:
@@ -658,97 +1440,155 @@ def update_button_states(selected_index):
         else:
             button["state"] = "INACTIVE"
         
-    # Change the background based on the selected button index
+    # Change the background and logo based on the selected button index
     background_index = selected_index
-    background = pygame.image.load(BG_IMAGES[background_index]).convert()
-    window_width, window_height = screen.get_size()
-    scaled_background = update_background(window_width, window_height)
-
-    # Change the logo based on the selected button index
     logo_index = selected_index
-    logo = pygame.image.load(LOGO_IMAGES[logo_index]).convert_alpha()
-    debug_log(f"Logo changed to {LOGO_IMAGES[logo_index]}")
-    debug_log(f"Background changed to {BG_IMAGES[background_index]}")
+    show_selected_artwork()
     
 def apply_deactivated_states(config):
     """Apply deactivated states based on configuration."""
-    if config.get("KH1.5+2.5") == "Not Installed":
+    if not is_collection_available(config, "KH1.5+2.5"):
         for i in [0, 1, 2, 3]:  # KH1, CoM, KH2, BBS (using 0-based indices)
             buttons[i]["state"] = "DEACTIVATED"
     
-    if config.get("KH2.8") == "Not Installed":
+    if not is_collection_available(config, "KH2.8"):
         for i in [4, 5]:  # DDD, AFP
             buttons[i]["state"] = "DEACTIVATED"
     
-    if config.get("KH3") == "Not Installed":
+    if not is_collection_available(config, "KH3"):
         buttons[6]["state"] = "DEACTIVATED"  # KH3
 
 def reapply_deactivated_states(config):
     for i, button in enumerate(buttons):
         # Reset DEACTIVATED state for KH1.5+2.5 buttons
-        if i <= 3 and config.get("KH1.5+2.5") == "Not Installed":  # Buttons 0-3 (KH1, CoM, KH2, BBS)
+        if i <= 3 and not is_collection_available(config, "KH1.5+2.5"):  # Buttons 0-3 (KH1, CoM, KH2, BBS)
             button["state"] = "DEACTIVATED"
             button["hovered_flag"] = False
             
         # Reset DEACTIVATED state for KH2.8 buttons
-        elif i in [4, 5] and config.get("KH2.8") == "Not Installed":  # Buttons 4-5 (DDD, AFP)
+        elif i in [4, 5] and not is_collection_available(config, "KH2.8"):  # Buttons 4-5 (DDD, AFP)
             button["state"] = "DEACTIVATED"
             button["hovered_flag"] = False
             
         # Reset DEACTIVATED state for KH3 button
-        elif i == 6 and config.get("KH3") == "Not Installed":  # Button 6 (KH3)
+        elif i == 6 and not is_collection_available(config, "KH3"):  # Button 6 (KH3)
             button["state"] = "DEACTIVATED"
             button["hovered_flag"] = False
             
+class Layout:
+    """All size-dependent geometry for one canvas: menu buttons, logo anchor and confirm dialog.
+
+    Drawing and hit testing both read from here, so they can never disagree. Built once per canvas size.
+    """
+
+    def __init__(self, canvas_rect, scale_factor):
+        self.canvas_rect = pygame.Rect(canvas_rect)
+        self.scale_factor = scale_factor
+        width, height = self.canvas_rect.size
+
+        # Menu buttons, one per row, centered on evenly spaced rows down the left edge
+        self.button_size = (int(500 * scale_factor), int(122 * scale_factor))
+        self.button_spacing = height / (NUM_BUTTONS + 1)
+        x_margin = int(width * 0.026)
+        self.button_rects = [
+            pygame.Rect(x_margin, int(self.button_spacing * (i + 1) - self.button_size[1] // 2), *self.button_size)
+            for i in range(NUM_BUTTONS)
+        ]
+
+        # Logo anchor, the float animation moves it up and down by up to float_amplitude
+        self.logo_anchor = (int(width * LOGO_ANCHOR[0]), height * LOGO_ANCHOR[1])
+        self.float_amplitude = height * FLOAT_AMPLITUDE
+
+        # Confirm dialog, fully open and centered (700x240 at full scale)
+        box_size = (int(700 * scale_factor), int(240 * scale_factor))
+        self.dialog_rect = pygame.Rect(((width - box_size[0]) // 2, (height - box_size[1]) // 2), box_size)
+
+        # YES/NO buttons and the cursor pointing at each of them
+        self.confirm_button_size = (int(178 * scale_factor), int(42 * scale_factor))
+        confirm_button_y = int(height * 0.5528)
+        self.confirm_button_rects = {
+            "YES": pygame.Rect((int(width * 0.3984), confirm_button_y), self.confirm_button_size),
+            "NO": pygame.Rect((int(width * 0.5089), confirm_button_y), self.confirm_button_size)
+        }
+        self.cursor_size = (int(63 * scale_factor), int(45 * scale_factor))
+        cursor_y = int(height * 0.5546)
+        self.cursor_positions = {
+            "YES": (int(width * 0.3740), cursor_y),
+            "NO": (int(width * 0.4844), cursor_y)
+        }
+
+    def to_canvas(self, window_pos):
+        """Map a window position to canvas coordinates."""
+        return window_pos[0] - self.canvas_rect.x, window_pos[1] - self.canvas_rect.y
+
+    def logo_position(self, elapsed_time):
+        """Top-left of the logo at this point of the float animation."""
+        y_offset = math.sin(elapsed_time * FLOAT_SPEED) * self.float_amplitude
+        return self.logo_anchor[0], int(self.logo_anchor[1] + y_offset)
+
+    def button_at(self, window_pos):
+        """Index of the menu button under a window position, or None.
+
+        Rows are evenly spaced, so the only candidate is the row nearest to y and a single rect check settles it.
+        """
+        x, y = self.to_canvas(window_pos)
+        index = int(y / self.button_spacing + 0.5) - 1
+        if 0 <= index < NUM_BUTTONS and self.button_rects[index].collidepoint(x, y):
+            return index
+        return None
+
+    def confirm_button_at(self, window_pos):
+        """The confirm button ("YES" or "NO") under a window position, or None."""
+        x, y = self.to_canvas(window_pos)
+        for choice, rect in self.confirm_button_rects.items():
+            if rect.collidepoint(x, y):
+                return choice
+        return None
+
+layout = None
+
+def mark_changed_buttons():
+    """Hovered buttons pulse every frame, the others only need redrawing when their look changed."""
+    for i, button in enumerate(buttons):
+        drawn_state = (button["state"], button["hovered_flag"], tuple(layout.button_rects[i]))
+        if button["hovered_flag"] or last_button_state[i] != drawn_state:
+            mark_dirty(layout.button_rects[i])
+        last_button_state[i] = drawn_state
+
 def scale_and_draw_buttons(canvas, scale_factor, elapsed_time):
     """Draw buttons to canvas according to their state, with hover and pulsing effects."""
-    button_height = int(122 * scale_factor)
-    button_width = int(500 * scale_factor)
-    vertical_spacing = canvas.get_height() / (NUM_BUTTONS + 1)
-    x_margin = int(canvas.get_width() * 0.026)
+    invalidate_scaled_sprites(canvas.get_size())
 
+    button_width, button_height = layout.button_size
     for i, button in enumerate(buttons):
-        button["rect"].width, button["rect"].height = button_width, button_height
-        button["rect"].topleft = (
-            x_margin,
-            int(vertical_spacing * (i + 1) - button_height // 2)
-        )
+        button_rect = layout.button_rects[i]
 
         # Draw ACTIVE or PRESSED states if applicable
-        if button["state"] == "PRESSED":
-            button_image = pygame.image.load(BUTTON_STATES["PRESSED"])
-        elif button["state"] == "ACTIVE":
-            button_image = pygame.image.load(BUTTON_STATES["ACTIVE"])
-        elif button["state"] == "DEACTIVATED":
-            button_image = pygame.image.load(BUTTON_STATES["DEACTIVATED"])   
+        if button["state"] in ["PRESSED", "ACTIVE", "DEACTIVATED"]:
+            button_image = get_scaled_sprite(BUTTON_STATES[button["state"]], button_width, button_height)
         else:
-            button_image = pygame.image.load(BUTTON_STATES["INACTIVE"])
+            button_image = get_scaled_sprite(BUTTON_STATES["INACTIVE"], button_width, button_height)
 
-        button_image = pygame.transform.smoothscale(button_image, (button_width, button_height))
-        canvas.blit(button_image, button["rect"].topleft)
+        canvas.blit(button_image, button_rect.topleft)
 
         if button["state"] == "DEACTIVATED":
-            title_image = pygame.image.load(os.path.join(os.path.dirname(__file__), "no-title.png"))
+            title_image = get_scaled_sprite(NO_TITLE_IMAGE, button_width, button_height)
         else:
-            title_image = pygame.image.load(TITLE_IMAGES[i])
+            title_image = get_scaled_sprite(TITLE_IMAGES[i], button_width, button_height)
 
-        title_image = pygame.transform.smoothscale(title_image, (button_width, button_height))
-        canvas.blit(title_image, button["rect"].topleft)
+        canvas.blit(title_image, button_rect.topleft)
 
         # Handle hover state
         if button["hovered_flag"]:
-            hovered_image_path = (
-                os.path.join(os.path.dirname(__file__), "button-3.png") if button["state"] == "ACTIVE" else os.path.join(os.path.dirname(__file__), "button-3b.png")
-            )
-            hovered_image = pygame.image.load(hovered_image_path)
-            hovered_image = pygame.transform.smoothscale(hovered_image, (button_width, button_height))
+            hovered_image_path = HOVER_IMAGES["ACTIVE"] if button["state"] == "ACTIVE" else HOVER_IMAGES["DEFAULT"]
+            hovered_image = get_scaled_sprite(hovered_image_path, button_width, button_height)
 
             # Apply pulsing effect with a sine wave
             alpha = int((math.sin(elapsed_time * 1.0 * math.pi) + 1) * 127.5)  # Slower pulsing
             hovered_image.set_alpha(alpha)
 
             # Blend hovered image onto the canvas
-            canvas.blit(hovered_image, button["rect"].topleft)
+            canvas.blit(hovered_image, button_rect.topleft)
 
 # Add a cooldown for switching input modes
 last_input_switch_time = 0  # Track the last switch time
@@ -762,17 +1602,17 @@ def handle_input_switch(event):
     if current_time - last_input_switch_time < input_switch_cooldown:
         return
 
-    if event.type in (pygame.MOUSEMOTION, MOUSEBUTTONDOWN):
+    if event.type in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN):
         if active_input != "mouse":
             active_input = "mouse"
             last_input_switch_time = current_time
             debug_log("Switched to mouse input.")
-    elif event.type in (pygame.JOYAXISMOTION, JOYBUTTONDOWN, JOYHATMOTION):
+    elif event.type in (pygame.JOYAXISMOTION, pygame.JOYBUTTONDOWN, pygame.JOYHATMOTION):
         if active_input != "controller":
             active_input = "controller"
             last_input_switch_time = current_time
             debug_log("Switched to controller input.")
-    elif event.type == KEYDOWN:
+    elif event.type == pygame.KEYDOWN:
         if active_input != "keyboard":
             active_input = "keyboard"
             last_input_switch_time = current_time
@@ -820,26 +1660,67 @@ def handle_pressed_state():
             buttons[pressed_button_index]["state"] = "ACTIVE"
             pressed_button_index = None  # Reset the pressed state
 
+# Input coalescing: a frame's events are drained together and the high-rate ones collapsed before they
+# reach the handlers, and the button state machine runs once per frame rather than once per event
+AXIS_DEADZONE = 0.3  # Stick movement inside this is drift and dropped
+last_hat_values = {}  # (joystick, hat) -> last value seen
+
+def coalesce_input_events(events):
+    """Keep the last mouse position between clicks, drop axis drift and collapse repeated hat values."""
+    # Walk backwards so the newest mouse position and axis value are the ones kept
+    kept = []
+    later_motion = False
+    later_axes = set()
+    for event in reversed(events):
+        if event.type == pygame.MOUSEMOTION:
+            if later_motion:
+                continue
+            later_motion = True
+        elif event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+            later_motion = False  # Motion before a click still decides what was clicked
+        elif event.type == pygame.JOYAXISMOTION:
+            if abs(event.value) < AXIS_DEADZONE or (event.instance_id, event.axis) in later_axes:
+                continue
+            later_axes.add((event.instance_id, event.axis))
+        kept.append(event)
+    kept.reverse()
+
+    coalesced = []
+    for event in kept:
+        if event.type == pygame.JOYHATMOTION:
+            key = (event.instance_id, event.hat)
+            if last_hat_values.get(key) == event.value:
+                continue
+            last_hat_values[key] = event.value
+        coalesced.append(event)
+    return coalesced
+
+def is_press_event(event):
+    """Events that can press a menu button."""
+    return (event.type == pygame.MOUSEBUTTONDOWN
+            or (event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE)
+            or (event.type == pygame.JOYBUTTONDOWN and event.button == 0))
+
 def handle_input_and_states(event, config):
     global active_input, selected_button_index
 
     # Handle input mode switching
     handle_input_switch(event)
 
+    # A press must see the selection made earlier in the same frame
+    if is_press_event(event):
+        update_button_states(selected_button_index)
+
     # Handle input based on active mode
     if active_input == "controller" and event.type in [pygame.JOYBUTTONDOWN, pygame.JOYHATMOTION]:
         handle_controller_navigation(event)
     elif active_input == "mouse":
         if event.type == pygame.MOUSEMOTION:
             handle_mouse_navigation(event)
-        elif event.type == MOUSEBUTTONDOWN:
+        elif event.type == pygame.MOUSEBUTTONDOWN:
             handle_mouse_selection(event)
-    elif active_input == "keyboard" and event.type == KEYDOWN:
+    elif active_input == "keyboard" and event.type == pygame.KEYDOWN:
         handle_keyboard_navigation(event)
-
-    # Update states and ensure DEACTIVATED states persist
-    update_button_states(selected_button_index)
-    reapply_deactivated_states(config)
     
 # Add these functions for the confirm dialog system
 def handle_confirm_input(event):
@@ -861,11 +1742,11 @@ def handle_confirm_input(event):
                 SELECTED_CONFIRM_BUTTON = "NO" if SELECTED_CONFIRM_BUTTON == "YES" else "YES"
                 play_sound("select.wav")
 
-    elif active_input == "keyboard" and event.type == KEYDOWN:
-        if event.key in [K_LEFT, K_RIGHT]:  # Arrow keys for keyboard
+    elif active_input == "keyboard" and event.type == pygame.KEYDOWN:
+        if event.key in [pygame.K_LEFT, pygame.K_RIGHT]:  # Arrow keys for keyboard
             SELECTED_CONFIRM_BUTTON = "NO" if SELECTED_CONFIRM_BUTTON == "YES" else "YES"
             play_sound("select.wav")
-        elif event.key == K_SPACE:  # Spacebar for confirm
+        elif event.key == pygame.K_SPACE:  # Spacebar for confirm
             handle_confirm_selection()
 
 def handle_confirm_selection():
@@ -876,104 +1757,80 @@ def handle_confirm_selection():
         CONFIRM_STATE = ConfirmState.CLOSING
         play_sound("close.wav")
     else:
-        play_sound("confirm.wav")
-        if launch_game(config, active_button_index):
-            pygame.quit()
-            sys.exit()
-        else:
-            CONFIRM_STATE = ConfirmState.CLOSING
-            play_sound("denied.wav")
+        start_launch(active_button_index)
+
+# Launch supervisor: launch_game runs on a background thread so the UI keeps animating
+launch_supervisor = None
+launch_future = None
+
+def get_launch_supervisor():
+    """The single background worker that runs launches (and the GamesConfig staging ahead of them)."""
+    global launch_supervisor
+    from concurrent.futures import ThreadPoolExecutor
+
+    if launch_supervisor is None:
+        launch_supervisor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="launch-supervisor")
+    return launch_supervisor
+
+def start_launch(button_index):
+    """Hand the launch to the background supervisor and show the launching state."""
+    global CONFIRM_STATE, SELECTED_CONFIRM_BUTTON, launch_future
+
+    play_sound("confirm.wav")
+    CONFIRM_STATE = ConfirmState.LAUNCHING
+    SELECTED_CONFIRM_BUTTON = "YES"
+    launch_future = get_launch_supervisor().submit(launch_game, config, button_index)
+
+def poll_launch():
+    """Check on a launch in progress. Returns True once the game has started, reopens the menu on failure."""
+    global CONFIRM_STATE, launch_future
+    if launch_future is None or not launch_future.done():
+        return False
+
+    future, launch_future = launch_future, None
+    try:
+        launched = future.result()
+    except Exception as e:
+        debug_log(f"Error launching game: {e}")
+        launched = False
+
+    if launched:
+        return True
+
+    CONFIRM_STATE = ConfirmState.CLOSING
+    play_sound("denied.wav")
+    return False
 
-def handle_confirm_mouse(mouse_pos, canvas_rect):
+def handle_confirm_mouse(mouse_pos):
     global SELECTED_CONFIRM_BUTTON, active_input
     
     if CONFIRM_STATE != ConfirmState.OPEN:
         return
 
-    # Calculate button dimensions based on canvas size
-    button_width = int(177 * (canvas_rect.width / 1920))
-    button_height = int(41 * (canvas_rect.height / 1080))
-    
-    # Button positions as percentages of canvas
-    yes_button_x = int(canvas_rect.width * 0.3984)
-    no_button_x = int(canvas_rect.width * 0.5089)
-    button_y = int(canvas_rect.height * 0.5528)
-
-    # Create precise rects for hit detection using top-left positioning
-    yes_button_rect = pygame.Rect(
-        yes_button_x, 
-        button_y, 
-        button_width, 
-        button_height
-    )
-
-    no_button_rect = pygame.Rect(
-        no_button_x, 
-        button_y, 
-        button_width, 
-        button_height
-    )
-
     # Check if mouse is over either button
-    if yes_button_rect.collidepoint(mouse_pos[0] - canvas_rect.x, mouse_pos[1] - canvas_rect.y):
-        if SELECTED_CONFIRM_BUTTON != "YES":
-            SELECTED_CONFIRM_BUTTON = "YES"
-            play_sound("select.wav")
-    elif no_button_rect.collidepoint(mouse_pos[0] - canvas_rect.x, mouse_pos[1] - canvas_rect.y):
-        if SELECTED_CONFIRM_BUTTON != "NO":
-            SELECTED_CONFIRM_BUTTON = "NO"
-            play_sound("select.wav")
+    hovered_choice = layout.confirm_button_at(mouse_pos)
+    if hovered_choice is not None and SELECTED_CONFIRM_BUTTON != hovered_choice:
+        SELECTED_CONFIRM_BUTTON = hovered_choice
+        play_sound("select.wav")
 
-def handle_confirm_mouse_click(event, canvas_rect):
+def handle_confirm_mouse_click(event):
     global CONFIRM_STATE
     
     if CONFIRM_STATE != ConfirmState.OPEN:
         return
 
-    # Calculate button dimensions based on canvas size
-    button_width = int(177 * (canvas_rect.width / 1920))
-    button_height = int(41 * (canvas_rect.height / 1080))
-    
-    # Button positions as percentages of canvas
-    yes_button_x = int(canvas_rect.width * 0.3984)
-    no_button_x = int(canvas_rect.width * 0.5089)
-    button_y = int(canvas_rect.height * 0.5528)
-
-    # Create precise rects for hit detection using top-left positioning
-    yes_button_rect = pygame.Rect(
-        yes_button_x, 
-        button_y, 
-        button_width, 
-        button_height
-    )
-
-    no_button_rect = pygame.Rect(
-        no_button_x, 
-        button_y, 
-        button_width, 
-        button_height
-    )
-
-    # Adjust mouse position to canvas coordinates
-    canvas_mouse_x = event.pos[0] - canvas_rect.x
-    canvas_mouse_y = event.pos[1] - canvas_rect.y
-
     # Check if mouse click is on either button
-    if yes_button_rect.collidepoint(canvas_mouse_x, canvas_mouse_y):
-        play_sound("confirm.wav")
-        if launch_game(config, active_button_index):
-            pygame.quit()
-            sys.exit()
-        else:
-            CONFIRM_STATE = ConfirmState.CLOSING
-            play_sound("denied.wav")
-    elif no_button_rect.collidepoint(canvas_mouse_x, canvas_mouse_y):
+    clicked_choice = layout.confirm_button_at(event.pos)
+    if clicked_choice == "YES":
+        start_launch(active_button_index)
+    elif clicked_choice == "NO":
         CONFIRM_STATE = ConfirmState.CLOSING
         play_sound("close.wav")
 
-def scale_and_draw_confirm_dialog(canvas, scale_factor, elapsed_time):
+def update_confirm_animation(canvas, scale_factor):
+    """Advance the confirm dialog's open/close animation and mark the regions it touches."""
     global CONFIRM_SCALE, CONFIRM_STATE
-    
+
     # Handle animation states
     if CONFIRM_STATE == ConfirmState.OPENING:
         CONFIRM_SCALE += CONFIRM_SCALE_UP_SPEED * clock.get_time() / 1000.0
@@ -986,86 +1843,131 @@ def scale_and_draw_confirm_dialog(canvas, scale_factor, elapsed_time):
         if CONFIRM_SCALE <= 0.0:
             CONFIRM_SCALE = 0.0
             CONFIRM_STATE = ConfirmState.CLOSED
-            
+            mark_dirty(canvas.get_rect())  # Clear the overlay everywhere
+
     if CONFIRM_STATE == ConfirmState.CLOSED:
         return
 
-    # Draw semi-transparent black overlay
-    overlay = pygame.Surface((canvas.get_width(), canvas.get_height()))
-    overlay.fill((0, 0, 0))
+    # While animating the overlay and box change everywhere, once open only the box pulses
+    if CONFIRM_STATE in [ConfirmState.OPEN, ConfirmState.LAUNCHING]:
+        mark_dirty(layout.dialog_rect)
+    else:
+        mark_dirty(canvas.get_rect())
+
+def get_confirm_frames(canvas, scale_factor):
+    """Build the overlay, animation keyframes and open-state widgets once per canvas size."""
+    global confirm_frames_size
+    if confirm_frames_size == canvas.get_size():
+        return confirm_frames
+
+    confirm_frames.clear()
+
+    # Semi-transparent black overlay
+    overlay = pygame.Surface(canvas.get_size())
+    overlay.fill(BLACK)
     overlay.set_alpha(CONFIRM_ALPHA)
-    canvas.blit(overlay, (0, 0))
+    confirm_frames["OVERLAY"] = overlay
+
+    # The last keyframe is the fully open box
+    box_width, box_height = layout.dialog_rect.size
+    confirm_frames["BOX"] = []
+    for frame in range(1, CONFIRM_KEYFRAMES + 1):
+        frame_scale = frame / CONFIRM_KEYFRAMES
+        confirm_frames["BOX"].append(pygame.transform.smoothscale(CONFIRM_IMAGES["BOX"], (
+            max(1, int(box_width * frame_scale)),
+            max(1, int(box_height * frame_scale))
+        )))
+    confirm_frames["TEXT"] = pygame.transform.smoothscale(CONFIRM_IMAGES["TEXT"], layout.dialog_rect.size)
+
+    # Buttons, glow and cursor are only drawn fully open, so they have a single size
+    for key in ["BUTTON_ACTIVE", "BUTTON_INACTIVE", "GLOW"]:
+        confirm_frames[key] = pygame.transform.smoothscale(CONFIRM_IMAGES[key], layout.confirm_button_size)
+    confirm_frames["CURSOR"] = pygame.transform.smoothscale(CONFIRM_IMAGES["CURSOR"], layout.cursor_size)
+
+    confirm_frames_size = canvas.get_size()
+    debug_log(f"Confirm dialog frames built for canvas size {confirm_frames_size}")
+    return confirm_frames
+
+def scale_and_draw_confirm_dialog(canvas, scale_factor, elapsed_time):
+    if CONFIRM_STATE == ConfirmState.CLOSED:
+        return
+
+    frames = get_confirm_frames(canvas, scale_factor)
+
+    # Draw semi-transparent black overlay
+    canvas.blit(frames["OVERLAY"], (0, 0))
 
     # Only draw the dialog if we're in an active state
     if CONFIRM_SCALE > 0:
-        # Explicitly set to 700x240 at full scale
-        base_width = 700
-        base_height = 240
-        
-        confirm_box_width = int(base_width * scale_factor * CONFIRM_SCALE)
-        confirm_box_height = int(base_height * scale_factor * CONFIRM_SCALE)
-        
+        # Pick the pre-scaled keyframe closest to the current animation scale
+        frame = min(CONFIRM_KEYFRAMES, max(1, math.ceil(CONFIRM_SCALE * CONFIRM_KEYFRAMES)))
+        confirm_box = frames["BOX"][frame - 1]
+
         # Center the dialog box
-        confirm_box_x = (canvas.get_width() - confirm_box_width) // 2
-        confirm_box_y = (canvas.get_height() - confirm_box_height) // 2
+        confirm_box_x = (canvas.get_width() - confirm_box.get_width()) // 2
+        confirm_box_y = (canvas.get_height() - confirm_box.get_height()) // 2
 
-        # Draw the box and text with preserved aspect ratios
-        confirm_box = pygame.transform.smoothscale(CONFIRM_IMAGES["BOX"], (confirm_box_width, confirm_box_height))
-        confirm_text = pygame.transform.smoothscale(CONFIRM_IMAGES["TEXT"], (confirm_box_width, confirm_box_height))
-        
         canvas.blit(confirm_box, (confirm_box_x, confirm_box_y))
 
-        # Draw buttons and cursor only when fully opened
-        if CONFIRM_STATE == ConfirmState.OPEN:
-            # Adjusted button positioning
-            confirm_button_width = int(178 * scale_factor)
-            confirm_button_height = int(42 * scale_factor)
-            confirm_button_y = int(canvas.get_height() * 0.5528)
-            
-            # Adjusted x-positions for buttons
-            yes_button_x = int(canvas.get_width() * 0.3984)
-            no_button_x = int(canvas.get_width() * 0.5089)
-
-            # YES button
-            yes_button_image = CONFIRM_IMAGES["BUTTON_ACTIVE"] if SELECTED_CONFIRM_BUTTON == "YES" else CONFIRM_IMAGES["BUTTON_INACTIVE"]
-            yes_button = pygame.transform.smoothscale(yes_button_image, (confirm_button_width, confirm_button_height))
-
-            # NO button
-            no_button_image = CONFIRM_IMAGES["BUTTON_ACTIVE"] if SELECTED_CONFIRM_BUTTON == "NO" else CONFIRM_IMAGES["BUTTON_INACTIVE"]
-            no_button = pygame.transform.smoothscale(no_button_image, (confirm_button_width, confirm_button_height))
+        # Draw buttons and cursor only when fully opened (the cursor is hidden while launching)
+        if CONFIRM_STATE in [ConfirmState.OPEN, ConfirmState.LAUNCHING]:
+            # YES and NO buttons
+            yes_button = frames["BUTTON_ACTIVE"] if SELECTED_CONFIRM_BUTTON == "YES" else frames["BUTTON_INACTIVE"]
+            no_button = frames["BUTTON_ACTIVE"] if SELECTED_CONFIRM_BUTTON == "NO" else frames["BUTTON_INACTIVE"]
 
             # Add glow effect to active button
-            glow = pygame.transform.smoothscale(CONFIRM_IMAGES["GLOW"], (confirm_button_width, confirm_button_height))
-            alpha = int((math.sin(elapsed_time * 1.0 * math.pi) + 1) * 127.5)
+            glow = frames["GLOW"]
+            pulse_speed = LAUNCH_PULSE_SPEED if CONFIRM_STATE == ConfirmState.LAUNCHING else 1.0
+            alpha = int((math.sin(elapsed_time * pulse_speed * math.pi) + 1) * 127.5)
             glow.set_alpha(alpha)
 
-            canvas.blit(confirm_box, (confirm_box_x, confirm_box_y))
-            canvas.blit(yes_button, (yes_button_x, confirm_button_y))
-            canvas.blit(no_button, (no_button_x, confirm_button_y))
-            
-            # Update cursor position based on adjusted button positions
-            if SELECTED_CONFIRM_BUTTON == "YES":
-                canvas.blit(glow, (yes_button_x, confirm_button_y))
-                cursor_x = int(canvas.get_width() * 0.3740)
-            else:
-                canvas.blit(glow, (no_button_x, confirm_button_y))
-                cursor_x = int(canvas.get_width() * 0.4844)
+            canvas.blit(yes_button, layout.confirm_button_rects["YES"].topleft)
+            canvas.blit(no_button, layout.confirm_button_rects["NO"].topleft)
+            canvas.blit(glow, layout.confirm_button_rects[SELECTED_CONFIRM_BUTTON].topleft)
 
-            # Draw cursor
-            cursor_width = int(63 * scale_factor)
-            cursor_height = int(45 * scale_factor)
-            cursor_y = int(canvas.get_height() * 0.5546)
-            
-            cursor_image = pygame.transform.smoothscale(CONFIRM_IMAGES["CURSOR"], (cursor_width, cursor_height))
+            # Draw cursor next to the selected button
+            if CONFIRM_STATE == ConfirmState.OPEN:
+                canvas.blit(frames["CURSOR"], layout.cursor_positions[SELECTED_CONFIRM_BUTTON])
+            canvas.blit(frames["TEXT"], (confirm_box_x, confirm_box_y))
 
-            canvas.blit(cursor_image, (cursor_x, cursor_y))
-            canvas.blit(confirm_text, (confirm_box_x, confirm_box_y))
+# Heroic GamesConfig staging: every game's file is read and its launch content prepared on the launch
+# supervisor at startup, so pressing YES only writes a file when its targetExe actually has to change.
+# Games of one collection share a file, so switching between them still costs one write.
+game_config_files = {}  # json_path -> {"signature", "hash", "data"} as last read or written
+staged_game_configs = {}  # button index -> (json_path, file signature it was built from, data, content)
 
-def update_game_config(config, button_index):
-    """Update the game's configuration JSON file with the correct targetExe path."""
+def get_file_signature(path):
+    """(mtime, inode, size) of a file, or None if it doesn't exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_ino, stat.st_size)
+
+def hash_content(content):
+    import hashlib
+    return hashlib.sha1(content).hexdigest()
+
+def read_game_config(json_path):
+    """Parsed GamesConfig file, read from disk only when it changed since the last read or write."""
+    signature = get_file_signature(json_path)
+    cached = game_config_files.get(json_path)
+    if cached is not None and cached["signature"] == signature:
+        return cached["data"]
+
+    content = b""
+    if signature is not None:
+        with open(json_path, "rb") as f:
+            content = f.read()
+    data = json.loads(content) if content.strip() else {}  # Only parse if file is not empty
+    game_config_files[json_path] = {"signature": signature, "hash": hash_content(content), "data": data}
+    return data
+
+def build_game_config(config, button_index):
+    """Work out the GamesConfig content that launches this game. Returns (json_path, data, content) or None."""
     if button_index not in GAME_CONFIGS:
         debug_log(f"Invalid button index: {button_index}")
-        return False
+        return None
         
     game_info = GAME_CONFIGS[button_index]
     collection = game_info["collection"]
@@ -1074,7 +1976,7 @@ def update_game_config(config, button_index):
     install_path = config.get(collection)
     if not install_path or install_path == "Not Installed":
         debug_log(f"Game collection {collection} is not installed")
-        return False
+        return None
         
     # Construct the full paths
     json_path = os.path.join(config["HeroicGamesConfig"], game_info["json"])
@@ -1083,37 +1985,71 @@ def update_game_config(config, button_index):
     # Validate that the exe exists
     if not os.path.exists(target_exe):
         debug_log(f"Target exe not found: {target_exe}")
-        return False
+        return None
+
+    # Work on a copy, the cached data has to keep matching the file
+    json_data = json.loads(json.dumps(read_game_config(json_path)))
+    
+    # Get the JSON ID (filename without extension)
+    json_id = os.path.splitext(game_info["json"])[0]
+    
+    # Create or update the configuration
+    if json_id not in json_data:
+        json_data[json_id] = {}
     
+    # Update targetExe while preserving other settings
+    json_data[json_id]["targetExe"] = target_exe.replace('\\', '/')  # Use forward slashes for paths
+    
+    # Ensure required fields exist
+    if "version" not in json_data:
+        json_data["version"] = "v0"
+    if "explicit" not in json_data:
+        json_data["explicit"] = True
+
+    return json_path, json_data, json.dumps(json_data, indent=2).encode("utf-8")
+
+def stage_game_configs(config):
+    """Read every game's GamesConfig file and prepare its launch content. Runs on the launch supervisor."""
+    for button_index in GAME_CONFIGS:
+        try:
+            staged = build_game_config(config, button_index)
+        except Exception as e:
+            debug_log(f"Error staging game config {button_index}: {e}")
+            continue
+        if staged is not None:
+            json_path, json_data, content = staged
+            staged_game_configs[button_index] = (json_path, game_config_files[json_path]["signature"], json_data, content)
+    debug_log(f"Staged game configs: {sorted(staged_game_configs)}")
+
+def update_game_config(config, button_index):
+    """Make sure the game's GamesConfig JSON points targetExe at this game, writing only if it doesn't yet."""
     try:
-        # Read existing JSON config if it exists
-        json_data = {}
-        if os.path.exists(json_path):
-            with open(json_path, 'r') as f:
-                content = f.read().strip()
-                if content:  # Only parse if file is not empty
-                    json_data = json.loads(content)
-        
-        # Get the JSON ID (filename without extension)
-        json_id = os.path.splitext(game_info["json"])[0]
-        
-        # Create or update the configuration
-        if json_id not in json_data:
-            json_data[json_id] = {}
-        
-        # Update targetExe while preserving other settings
-        json_data[json_id]["targetExe"] = target_exe.replace('\\', '/')  # Use forward slashes for paths
-        
-        # Ensure required fields exist
-        if "version" not in json_data:
-            json_data["version"] = "v0"
-        if "explicit" not in json_data:
-            json_data["explicit"] = True
-            
-        # Write the updated config back to file
-        with open(json_path, 'w') as f:
-            json.dump(json_data, f, indent=2)
-            
+        staged = staged_game_configs.get(button_index)
+        if staged is not None and get_file_signature(staged[0]) == staged[1]:
+            json_path, _, json_data, content = staged
+        else:
+            # Not staged yet, or the file changed since (another game of the collection was launched, or Heroic wrote it)
+            staged = build_game_config(config, button_index)
+            if staged is None:
+                return False
+            json_path, json_data, content = staged
+
+        # Identical bytes, or the same settings formatted differently, need no write
+        content_hash = hash_content(content)
+        cached = game_config_files[json_path]
+        if cached["hash"] == content_hash or cached["data"] == json_data:
+            debug_log(f"Game config already up to date: {json_path}")
+            return True
+
+        # Write the updated config through a temporary file, Heroic must never see a half-written one
+        temp_path = json_path + ".tmp"
+        with open(temp_path, "wb") as f:
+            f.write(content)
+        os.replace(temp_path, json_path)
+
+        signature = get_file_signature(json_path)
+        game_config_files[json_path] = {"signature": signature, "hash": content_hash, "data": json_data}
+        staged_game_configs[button_index] = (json_path, signature, json_data, content)
         debug_log(f"Successfully updated game config: {json_path}")
         return True
         
@@ -1121,23 +2057,250 @@ def update_game_config(config, button_index):
         debug_log(f"Error updating game config: {e}")
         return False
 
+# Launch readiness: a launch succeeds as soon as the game's exe shows up in the process list,
+# and fails as soon as Heroic's helper exits without starting it
+LAUNCH_READY_TIMEOUT = 30.0  # Seconds to wait for the game process to appear
+LAUNCH_POLL_INTERVAL = 0.1  # Seconds between process list scans
+LAUNCH_FALLBACK_WAIT = 2.0  # Where processes can't be listed, the helper only has to stay alive this long
+running_game_pid = None  # Game process found by the last successful launch, None if only the helper was seen
+
+def list_processes():
+    """Map pid -> (parent pid, command line arguments), or None where processes can't be listed.
+
+    Windows lists them from a ToolHelp snapshot, which only has the exe name to stand in for the arguments.
+    """
+    if os.name == "nt":
+        import ctypes
+        from ctypes import wintypes
+
+        class PROCESSENTRY32W(ctypes.Structure):
+            _fields_ = [
+                ("dwSize", wintypes.DWORD), ("cntUsage", wintypes.DWORD), ("th32ProcessID", wintypes.DWORD),
+                ("th32DefaultHeapID", ctypes.c_size_t), ("th32ModuleID", wintypes.DWORD),
+                ("cntThreads", wintypes.DWORD), ("th32ParentProcessID", wintypes.DWORD),
+                ("pcPriClassBase", wintypes.LONG), ("dwFlags", wintypes.DWORD),
+                ("szExeFile", ctypes.c_wchar * wintypes.MAX_PATH)
+            ]
+
+        TH32CS_SNAPPROCESS = 0x2
+        kernel32 = ctypes.windll.kernel32
+        kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+        snapshot = kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+        if snapshot is None or snapshot == ctypes.c_void_p(-1).value:
+            return None
+
+        processes = {}
+        entry = PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(entry)
+        try:
+            found = kernel32.Process32FirstW(wintypes.HANDLE(snapshot), ctypes.byref(entry))
+            while found:
+                processes[entry.th32ProcessID] = (entry.th32ParentProcessID, [entry.szExeFile])
+                found = kernel32.Process32NextW(wintypes.HANDLE(snapshot), ctypes.byref(entry))
+        finally:
+            kernel32.CloseHandle(wintypes.HANDLE(snapshot))
+        return processes
+
+    if not os.path.isdir("/proc/self"):
+        return None
+
+    processes = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", "rb") as f:
+                stat = f.read()
+            with open(f"/proc/{entry}/cmdline", "rb") as f:
+                cmdline = f.read()
+        except OSError:
+            continue  # The process exited while we were looking at it
+        # The command name in stat may contain spaces and parentheses, the fields after it cannot
+        parent_pid = int(stat[stat.rindex(b")") + 2:].split()[1])
+        processes[int(entry)] = (parent_pid, cmdline.decode("utf-8", "replace").split("\0"))
+    return processes
+
+def process_is_running(pid):
+    """True while the process exists and has not exited (zombies count as exited)."""
+    if os.name == "nt":
+        import ctypes
+        PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+        STILL_ACTIVE = 259
+        handle = ctypes.windll.kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            return False
+        exit_code = ctypes.c_ulong()
+        found = ctypes.windll.kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code))
+        ctypes.windll.kernel32.CloseHandle(handle)
+        return bool(found) and exit_code.value == STILL_ACTIVE
+
+    if os.path.isdir("/proc/self"):
+        try:
+            with open(f"/proc/{pid}/stat", "rb") as f:
+                stat = f.read()
+        except OSError:
+            return False
+        return stat[stat.rindex(b")") + 2:].split()[0] not in [b"Z", b"X"]
+
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass  # Exists, but belongs to someone else
+    return True
+
+def command_runs_file(arguments, file_name):
+    """True if the program (Windows or POSIX style path) is a file with this name.
+
+    Only the first argument counts: Heroic hands the game's exe to legendary as --override-exe, and Wine
+    shows a game by its Windows exe path.
+    """
+    return os.path.basename(arguments[0].replace("\\", "/")).lower() == file_name.lower()
+
+def find_processes_running(processes, file_name):
+    """Pids of the processes running a file with this name."""
+    return {pid for pid, (parent_pid, arguments) in processes.items() if command_runs_file(arguments, file_name)}
+
+def wait_for_game_ready(process, game_exe, heroic_path, existing_pids, heroic_warm=False):
+    """Watch the process list until the game's exe shows up. Returns its pid, or None if the launch failed."""
+    exe_name = os.path.basename(game_exe.replace("\\", "/"))
+    deadline = time.monotonic() + LAUNCH_READY_TIMEOUT
+
+    while True:
+        processes = list_processes()
+        if processes is None:
+            break  # Processes can't be listed here, fall back to watching the helper
+
+        game_pids = find_processes_running(processes, exe_name) - existing_pids
+        if game_pids:
+            debug_log(f"Game process found: {exe_name} (pid {min(game_pids)})")
+            return min(game_pids)
+
+        if process.poll() is not None:
+            # A helper that handed the launch to an already running Heroic exits straight away with code 0,
+            # keep watching then. Any other exit is a failed launch
+            heroic_pids = find_processes_running(processes, os.path.basename(heroic_path)) - {process.pid}
+            if process.returncode != 0 or not (heroic_pids or heroic_warm):
+                debug_log(f"Heroic helper exited with code {process.returncode} before the game started")
+                return None
+
+        if time.monotonic() > deadline:
+            debug_log(f"Timed out waiting for {exe_name} to start")
+            return None
+        time.sleep(LAUNCH_POLL_INTERVAL)
+
+    # The helper has to survive a short wait, failing as soon as it exits. One that handed the request to a
+    # warm Heroic exits straight away with code 0 though, that is a launch too
+    deadline = time.monotonic() + LAUNCH_FALLBACK_WAIT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            if heroic_warm and process.returncode == 0:
+                debug_log("Launch request handed to the warm Heroic")
+                return process.pid
+            return None
+        time.sleep(LAUNCH_POLL_INTERVAL)
+    return process.pid
+
+# Direct launch (-direct or "DirectLaunch": true in LauncherConfig.json): the game is started from its own
+# GamesConfig settings instead of cold-starting Heroic. Settings it can't reproduce fall back to Heroic.
+DIRECT_LAUNCH_UNSUPPORTED = ["useGameMode", "showMangohud", "nvidiaPrime", "useSteamRuntime", "eacRuntime",
+                             "battlEyeRuntime", "enableFSR", "enableDXVKFpsLimit", "showFps"]
+DIRECT_LAUNCH_SYNC_FLAGS = {"enableEsync": "WINEESYNC", "enableFsync": "WINEFSYNC", "enableMsync": "WINEMSYNC"}
+
+def split_arguments(arguments):
+    """Split an argument string like the platform's shell, keeping the backslashes of Windows paths."""
+    import shlex
+    if os.name != "nt":
+        return shlex.split(arguments)
+    return [argument[1:-1] if len(argument) > 1 and argument[0] == argument[-1] == '"' else argument
+            for argument in shlex.split(arguments, posix=False)]
+
+def direct_launch_enabled(config):
+    return "-direct" in sys.argv or config.get("DirectLaunch") is True
+
+def get_direct_launch_command(config, button_index):
+    """Command, environment and working folder that start the game without Heroic, or None to use Heroic."""
+    game_info = GAME_CONFIGS[button_index]
+    game_id = os.path.splitext(game_info["json"])[0]
+    json_path = os.path.join(config["HeroicGamesConfig"], game_info["json"])
+
+    try:
+        settings = read_game_config(json_path).get(game_id, {})
+
+        unsupported = [key for key in DIRECT_LAUNCH_UNSUPPORTED if settings.get(key)]
+        if unsupported:
+            debug_log(f"Direct launch not possible, {game_id} uses {unsupported}")
+            return None
+
+        target_exe = settings.get("targetExe")
+        if not target_exe or not os.path.isfile(target_exe):
+            debug_log(f"Direct launch not possible, targetExe not found: {target_exe}")
+            return None
+
+        command = []
+        for wrapper in settings.get("wrapperOptions", []):
+            command.append(wrapper["exe"])
+            command += split_arguments(wrapper.get("args", ""))
+
+        env = dict(os.environ)
+        for variable in settings.get("enviromentOptions", []):  # Heroic's spelling
+            env[variable["key"]] = variable["value"]
+
+        # Outside Windows the exe runs through the configured Wine build and prefix, Proton and others go through Heroic
+        if os.name != "nt":
+            wine = settings.get("wineVersion") or {}
+            if wine.get("type") != "wine" or not wine.get("bin") or not settings.get("winePrefix"):
+                debug_log(f"Direct launch not possible, unsupported runner: {wine}")
+                return None
+            command.append(wine["bin"])
+            env["WINEPREFIX"] = os.path.expanduser(settings["winePrefix"])
+            for key, variable in DIRECT_LAUNCH_SYNC_FLAGS.items():
+                if settings.get(key):
+                    env[variable] = "1"
+
+        command.append(target_exe)
+        command += split_arguments(settings.get("launcherArgs", ""))
+        return command, env, os.path.dirname(target_exe)
+
+    except (KeyError, TypeError, ValueError, OSError) as e:
+        debug_log(f"Direct launch not possible, unreadable settings for {game_id}: {e}")
+        return None
+
 def launch_game(config, button_index):
-    """Update the game config and launch the game using Heroic."""
+    """Update the game config and launch the game, through Heroic or directly."""
+    global running_game_pid, prewarm_used
     if update_game_config(config, button_index):
         game_info = GAME_CONFIGS[button_index]
         
         try:
-            # Get game ID and launch command based on OS
             game_id = os.path.splitext(game_info["json"])[0]
-            launch_cmd = get_heroic_launch_command(game_id)
-            
-            process = subprocess.Popen(launch_cmd)
-            
-            # Wait a short time to ensure the process starts
-            time.sleep(2)
-            
-            # Check if process is running
-            if process.poll() is None:  # None means process is still running
+
+            # Start the game ourselves when asked to and its settings allow it
+            direct_launch = get_direct_launch_command(config, button_index) if direct_launch_enabled(config) else None
+            if direct_launch is not None:
+                launch_cmd, launch_env, launch_dir = direct_launch
+                debug_log(f"Launching directly: {launch_cmd}")
+            else:
+                # Get launch command based on OS
+                launch_cmd, launch_env, launch_dir = get_heroic_launch_command(game_id), None, None
+
+            # Copies of the game that were already running don't count as this launch
+            processes = list_processes()
+            existing_pids = find_processes_running(processes, os.path.basename(game_info["exe"])) if processes else set()
+
+            import subprocess
+            heroic_warm = direct_launch is None and heroic_is_warm()
+            process = subprocess.Popen(launch_cmd, env=launch_env, cwd=launch_dir)
+
+            # Wait for the game itself to show up
+            game_pid = wait_for_game_ready(process, game_info["exe"], launch_cmd[0], existing_pids, heroic_warm)
+            if game_pid is not None:
+                # Without a process list the pid is the helper's, unless the game exe itself was started
+                game_found = processes is not None or command_runs_file(launch_cmd, os.path.basename(game_info["exe"]))
+                running_game_pid = game_pid if game_found else None
+                if heroic_warm:
+                    prewarm_used = True  # The warm Heroic runs the game now, it must outlive the launcher
                 debug_log(f"Game launch process started successfully: {game_id}")
                 return True
             else:
@@ -1149,10 +2312,545 @@ def launch_game(config, button_index):
             return False
     return False
             
+# Heroic pre-warm (-prewarm or "PrewarmHeroic": true in LauncherConfig.json): a hidden Heroic is started, or
+# a running one reused, as soon as the menu appears. Launching then only hands heroic://launch/<id> over to
+# it, as a second Heroic forwards its arguments to the running instance and exits.
+PREWARM_RETRIES = 3  # Restarts of a warm instance that exits with an error
+PREWARM_BACKOFF = 2.0  # Seconds before the first restart, doubled for each one after
+PREWARM_POLL_INTERVAL = 0.5  # Seconds between checks on the warm instance
+prewarm_process = None  # The Heroic the launcher started
+prewarm_reused = False  # Heroic was already running, so it is not ours to stop
+prewarm_ready = False
+prewarm_attempts = 0
+prewarm_restart_at = None
+prewarm_next_check = 0.0
+prewarm_used = False  # A game was launched through the warm Heroic, so it has to outlive the launcher
+
+def prewarm_enabled(config):
+    return "-prewarm" in sys.argv or config.get("PrewarmHeroic") is True
+
+def heroic_is_warm():
+    """True while a ready Heroic is there to take launch requests."""
+    if prewarm_reused:
+        return True
+    process = prewarm_process  # The main thread may drop it while we look
+    return prewarm_ready and process is not None and process.poll() is None
+
+def start_heroic_prewarm(config):
+    """Reuse a running Heroic, or start a hidden one."""
+    global prewarm_process, prewarm_reused, prewarm_attempts, prewarm_next_check
+    import subprocess
+
+    heroic_path = config.get("HeroicPath")
+    if not heroic_path:
+        return
+
+    processes = list_processes()
+    if processes and find_processes_running(processes, os.path.basename(heroic_path)):
+        prewarm_reused = True
+        debug_log("Heroic is already running, reusing it")
+        return
+
+    # Its own session, so the whole process tree can be stopped again
+    popen_options = {} if os.name == "nt" else {"start_new_session": True}
+    try:
+        prewarm_process = subprocess.Popen(
+            [heroic_path, "--no-gui", "--no-sandbox"],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, **popen_options
+        )
+    except OSError as e:
+        debug_log(f"Could not pre-warm Heroic: {e}")
+        return
+    prewarm_attempts += 1
+    prewarm_next_check = time.time() + PREWARM_POLL_INTERVAL
+    debug_log(f"Pre-warming Heroic (pid {prewarm_process.pid}, attempt {prewarm_attempts})")
+
+def poll_heroic_prewarm(config):
+    """Note when the warm Heroic is ready, and restart it with back-off if it fails."""
+    global prewarm_process, prewarm_reused, prewarm_ready, prewarm_restart_at, prewarm_next_check
+    now = time.time()
+
+    if prewarm_process is None:
+        if prewarm_restart_at is not None and now >= prewarm_restart_at:
+            prewarm_restart_at = None
+            start_heroic_prewarm(config)
+        return
+
+    if now < prewarm_next_check:
+        return
+    prewarm_next_check = now + PREWARM_POLL_INTERVAL
+
+    returncode = prewarm_process.poll()
+    if returncode is None:
+        if not prewarm_ready:
+            # Heroic is up once its main process has started its helper processes
+            processes = list_processes()
+            if processes is None or any(parent_pid == prewarm_process.pid for parent_pid, _ in processes.values()):
+                prewarm_ready = True
+                debug_log("Warm Heroic is ready")
+        return
+
+    prewarm_process = None
+    prewarm_ready = False
+    if returncode == 0:
+        prewarm_reused = True  # Handed over to a Heroic that was started in the meantime
+    elif prewarm_attempts <= PREWARM_RETRIES:
+        delay = PREWARM_BACKOFF * 2 ** (prewarm_attempts - 1)
+        prewarm_restart_at = now + delay
+        debug_log(f"Warm Heroic exited with code {returncode}, restarting in {delay:.0f}s")
+    else:
+        debug_log(f"Warm Heroic exited with code {returncode}, giving up")
+
+def stop_heroic_prewarm():
+    """Stop the Heroic the launcher started, unless a game was launched through it."""
+    import subprocess
+    if prewarm_process is None or prewarm_used or prewarm_process.poll() is not None:
+        return
+
+    debug_log("Stopping the unused warm Heroic")
+    try:
+        if os.name == "nt":
+            subprocess.run(["taskkill", "/PID", str(prewarm_process.pid), "/T", "/F"], capture_output=True)
+        else:
+            import signal
+            os.killpg(prewarm_process.pid, signal.SIGTERM)
+        prewarm_process.wait(timeout=5)
+    except (OSError, subprocess.TimeoutExpired):
+        prewarm_process.kill()
+
+# Resident mode (-resident or "ResidentMode": true in LauncherConfig.json): after a launch the launcher
+# hides its window, frees its surfaces and sleeps until the game exits, then brings the menu back
+RESIDENT_POLL_INTERVAL = 1.0  # Seconds between checks on the game process
+resident_mode = False
+
+def free_launcher_artwork():
+    """Drop every decoded and scaled surface the menu holds."""
+    global CONFIRM_IMAGES, background, logo, scaled_background, canvas, shown_artwork_index
+    global scaled_sprites_canvas_size, scaled_backgrounds_size, confirm_frames_size, drawn_logo_rect
+
+    # Wait out decodes still in flight so their surfaces are released too
+    for future in list(pending_artwork):
+        future.exception()
+    pending_artwork.clear()
+
+    for cache in [sprite_sources, scaled_sprites, decoded_backgrounds, decoded_logos, scaled_backgrounds, scaled_logos, confirm_frames]:
+        cache.clear()
+    CONFIRM_IMAGES = {}
+    background = logo = scaled_background = canvas = None
+    shown_artwork_index = None
+    scaled_sprites_canvas_size = scaled_backgrounds_size = confirm_frames_size = None
+    drawn_logo_rect = None
+    for i in range(NUM_BUTTONS):
+        last_button_state[i] = None
+
+def wait_for_game_exit(pid):
+    """Sleep until the game process exits."""
+    debug_log(f"Resident mode: waiting for process {pid} to exit")
+    while process_is_running(pid):
+        time.sleep(RESIDENT_POLL_INTERVAL)
+        pygame.event.pump()  # Keep the hidden window responsive to the OS
+
+def run_resident(pid):
+    """Hide the launcher while the game runs, then restore the menu."""
+    global screen, CONFIRM_STATE, CONFIRM_SCALE, active_button_index, pressed_button_index
+
+    # Hide the window and let go of every surface
+    screen = pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    free_launcher_artwork()
+    if asset_bundle is None:
+        print("Note: Without an asset bundle, returning from resident mode decodes the artwork again. Run with --build-bundle to create one.")
+
+    wait_for_game_exit(pid)
+
+    # Back to the menu, with the dialog closed and nothing pressed
+    CONFIRM_STATE = ConfirmState.CLOSED
+    CONFIRM_SCALE = 0.0
+    active_button_index = None
+    pressed_button_index = None
+    for button in buttons:
+        if button["state"] != "DEACTIVATED":
+            button["state"] = "INACTIVE"
+
+    open_window()
+    load_launcher_artwork()
+    rebuild_layout()
+    pygame.event.clear()
+    debug_log("Resident mode: menu restored")
+
+def rebuild_layout():
+    """Rebuild the canvas and all size-dependent geometry. Only needed on resize or fullscreen toggle."""
+    global canvas, canvas_rect, scale_factor, scaled_background, layout
+
+    window_width, window_height = screen.get_size()
+    canvas_rect = calculate_canvas_fit(window_width, window_height)
+    canvas = pygame.Surface((canvas_rect.width, canvas_rect.height))
+    scale_factor = canvas_rect.width / ASSET_RESOLUTION[0]
+
+    if layout is None or layout.canvas_rect != canvas_rect:
+        layout = Layout(canvas_rect, scale_factor)
+    get_confirm_frames(canvas, scale_factor)  # Built now so opening the dialog never has to scale
+    scaled_background = get_scaled_background(shown_artwork_index, window_width, window_height)
+    request_full_redraw()
+    debug_log(f"Layout rebuilt for {window_width}x{window_height}, canvas {canvas_rect}")
+
+def render_frame(elapsed_time):
+    """Redraw the changed regions of the persistent canvas and push them to the screen."""
+    # The logo is scaled once per canvas size, the float animation only moves it
+    phase_started = time.perf_counter()
+    scaled_logo = get_scaled_logo(shown_artwork_index, canvas_rect.size)
+    profile_phase("logo", phase_started)
+    logo_position = layout.logo_position(elapsed_time)
+
+    # Work out what changed before drawing anything
+    mark_changed_buttons()
+    mark_logo_dirty(scaled_logo.get_rect(topleft=logo_position))
+    update_confirm_animation(canvas, scale_factor)
+    update_profile_overlay(canvas)
+
+    # Redraw each changed region from the background up, clipped to that region
+    regions = get_redraw_regions(canvas)
+    for region in regions:
+        canvas.set_clip(region)
+        phase_started = time.perf_counter()
+        canvas.blit(scaled_background, (0, 0))
+        profile_phase("blits", phase_started)
+
+        phase_started = time.perf_counter()
+        scale_and_draw_buttons(canvas, scale_factor, elapsed_time)
+        profile_phase("buttons", phase_started)
+
+        # Draw the scaled logo over the background and buttons
+        phase_started = time.perf_counter()
+        canvas.blit(scaled_logo, logo_position)
+        profile_phase("logo", phase_started)
+
+        # Draw the confirm dialog if it's active
+        if CONFIRM_STATE != ConfirmState.CLOSED:
+            phase_started = time.perf_counter()
+            scale_and_draw_confirm_dialog(canvas, scale_factor, elapsed_time)
+            profile_phase("dialog", phase_started)
+
+        if profile_overlay is not None:
+            canvas.blit(profile_overlay, profile_overlay_rect)
+    canvas.set_clip(None)
+
+    present_canvas(canvas, canvas_rect, regions)
+
+# Frame profiler (--profile): times each phase of the main loop, shows rolling averages and p99 values in
+# a corner overlay and writes the per-frame trace to LauncherProfile.json and LauncherProfile.csv on exit
+PROFILE_PHASES = ["events", "buttons", "logo", "dialog", "blits", "flip"]
+PROFILE_WINDOW = 240  # Frames covered by the overlay statistics
+PROFILE_OVERLAY_INTERVAL = 0.5  # Seconds between overlay refreshes
+PROFILE_TRACE_NAME = "LauncherProfile"
+profiling = "--profile" in sys.argv
+profile_frame = {}  # Phase -> seconds spent in it during the current frame
+profile_trace = []  # One sample per frame, in milliseconds
+profile_start = time.perf_counter()
+profile_font = None
+profile_overlay = None
+profile_overlay_rect = None
+profile_overlay_time = 0.0
+
+def profile_phase(phase, started):
+    """Add the time since `started` to a phase of the current frame."""
+    if profiling:
+        profile_frame[phase] = profile_frame.get(phase, 0.0) + time.perf_counter() - started
+
+def end_profile_frame(frame_started):
+    """Record the finished frame in the trace."""
+    if not profiling:
+        return
+    sample = {"time": round((frame_started - profile_start) * 1000, 3)}
+    for phase in PROFILE_PHASES:
+        sample[phase] = round(profile_frame.get(phase, 0.0) * 1000, 3)
+    sample["total"] = round((time.perf_counter() - frame_started) * 1000, 3)
+    profile_trace.append(sample)
+    profile_frame.clear()
+
+def get_profile_stats(samples):
+    """Average and p99 in milliseconds for each phase and the whole frame."""
+    stats = {}
+    for phase in PROFILE_PHASES + ["total"]:
+        values = sorted(sample[phase] for sample in samples)
+        p99_index = min(len(values) - 1, int(len(values) * 0.99))
+        stats[phase] = {"avg": round(sum(values) / len(values), 3), "p99": values[p99_index]}
+    return stats
+
+def update_profile_overlay(canvas):
+    """Re-render the statistics overlay every PROFILE_OVERLAY_INTERVAL and mark it for redrawing."""
+    global profile_font, profile_overlay, profile_overlay_rect, profile_overlay_time
+    if not profiling or not profile_trace:
+        return
+    now = time.perf_counter()
+    if profile_overlay is not None and now - profile_overlay_time < PROFILE_OVERLAY_INTERVAL:
+        # Follow the canvas corner after a resize
+        profile_overlay_rect = profile_overlay.get_rect(topright=(canvas.get_width() - 8, 8))
+        return
+    profile_overlay_time = now
+
+    if profile_font is None:
+        profile_font = pygame.font.Font(None, 20)
+    stats = get_profile_stats(profile_trace[-PROFILE_WINDOW:])
+    rows = [("ms", "avg", "p99")]
+    for phase, values in stats.items():
+        rows.append((phase, f"{values['avg']:.2f}", f"{values['p99']:.2f}"))
+
+    # Phase names left-aligned, numbers right-aligned in fixed columns
+    line_height = profile_font.get_linesize()
+    column_right = [0, 120, 180]
+    overlay = pygame.Surface((column_right[-1] + 12, line_height * len(rows) + 8), pygame.SRCALPHA)
+    overlay.fill((0, 0, 0, 170))
+    for i, row in enumerate(rows):
+        y = 4 + i * line_height
+        overlay.blit(profile_font.render(row[0], True, WHITE), (6, y))
+        for text, right in zip(row[1:], column_right[1:]):
+            cell = profile_font.render(text, True, WHITE)
+            overlay.blit(cell, cell.get_rect(topright=(right + 6, y)))
+
+    if profile_overlay_rect is not None:
+        mark_dirty(profile_overlay_rect)
+    profile_overlay = overlay
+    profile_overlay_rect = overlay.get_rect(topright=(canvas.get_width() - 8, 8))
+    mark_dirty(profile_overlay_rect)
+
+def write_profile_trace():
+    """Write the recorded frames to LauncherProfile.json (with a summary) and LauncherProfile.csv."""
+    if not profiling or not profile_trace:
+        return
+    columns = ["time"] + PROFILE_PHASES + ["total"]
+    try:
+        with open(PROFILE_TRACE_NAME + ".json", "w") as f:
+            json.dump({"phases": PROFILE_PHASES, "summary": get_profile_stats(profile_trace), "frames": profile_trace}, f)
+        with open(PROFILE_TRACE_NAME + ".csv", "w") as f:
+            f.write(",".join(columns) + "\n")
+            for sample in profile_trace:
+                f.write(",".join(str(sample[column]) for column in columns) + "\n")
+        print(f"Profile trace of {len(profile_trace)} frames written to {PROFILE_TRACE_NAME}.json and {PROFILE_TRACE_NAME}.csv")
+    except OSError as e:
+        print(f"Error writing profile trace: {e}")
+
+# Adaptive frame rate: full rate while input is recent or the confirm dialog is up, a low rate once the
+# menu sits idle, and blocking on the event queue while the window is minimized or unfocused
+ACTIVE_FRAME_RATE = 60
+IDLE_FRAME_RATE = 20  # Still smooth for the slow logo float and button pulse
+IDLE_AFTER = 3.0  # Seconds without input before dropping to the idle rate
+BACKGROUND_WAIT_MS = 250  # Longest wait for an event while minimized or unfocused
+last_input_time = 0.0
+window_focused = True
+window_minimized = False
+
+def track_activity(event):
+    """Record input and window focus changes for the frame scheduler."""
+    global last_input_time, window_focused, window_minimized
+    if event.type in (pygame.KEYDOWN, pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEWHEEL,
+                      pygame.JOYBUTTONDOWN, pygame.JOYHATMOTION, pygame.JOYAXISMOTION):
+        last_input_time = time.time()
+    elif event.type == pygame.WINDOWFOCUSLOST:
+        window_focused = False
+    elif event.type == pygame.WINDOWFOCUSGAINED:
+        window_focused = True
+        last_input_time = time.time()
+    elif event.type == pygame.WINDOWMINIMIZED:
+        window_minimized = True
+    elif event.type in (pygame.WINDOWRESTORED, pygame.WINDOWMAXIMIZED, pygame.WINDOWSHOWN):
+        if window_minimized:
+            window_minimized = False
+            request_full_redraw()
+
+def window_in_background():
+    return window_minimized or not window_focused
+
+def get_frame_rate():
+    """Full rate while something reacts to the user, the idle rate otherwise."""
+    if CONFIRM_STATE != ConfirmState.CLOSED or pressed_button_index is not None:
+        return ACTIVE_FRAME_RATE
+    if time.time() - last_input_time < IDLE_AFTER:
+        return ACTIVE_FRAME_RATE
+    return IDLE_FRAME_RATE
+
+def get_frame_events():
+    """Events for this frame. In the background this blocks until an event arrives or the wait times out."""
+    if not window_in_background():
+        return pygame.event.get()
+    event = pygame.event.wait(BACKGROUND_WAIT_MS)
+    events = [] if event.type == pygame.NOEVENT else [event]
+    return events + pygame.event.get()
+
+# Headless rendering benchmark (--benchmark): renders a fixed number of frames through the real render path
+# at each resolution with the confirm dialog closed and open, and compares against the previous stored run
+BENCHMARK_RESOLUTIONS = [(1280, 720), (1280, 800), (1920, 1080), (2560, 1440), (3840, 2160)]
+BENCHMARK_FRAMES = 300
+BENCHMARK_RESULTS_FILE = "LauncherBenchmark.json"
+BENCHMARK_HISTORY = 20  # Runs kept in the results file
+BENCHMARK_REGRESSION_TOLERANCE = 0.10  # Relative fps drop or p99 rise that counts as a regression
+BENCHMARK_NOISE_MS = 0.5  # p99 changes smaller than this are ignored
+
+def get_peak_rss_mb():
+    """Peak resident set size of this process in MB, or None where it can't be read."""
+    if os.name == "nt":
+        import ctypes
+        from ctypes import wintypes
+
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD)] + [
+                (name, ctypes.c_size_t) for name in [
+                    "PeakWorkingSetSize", "WorkingSetSize", "QuotaPeakPagedPoolUsage", "QuotaPagedPoolUsage",
+                    "QuotaPeakNonPagedPoolUsage", "QuotaNonPagedPoolUsage", "PagefileUsage", "PeakPagefileUsage"
+                ]
+            ]
+
+        counters = PROCESS_MEMORY_COUNTERS()
+        counters.cb = ctypes.sizeof(counters)
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+        if not ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+            return None
+        return round(counters.PeakWorkingSetSize / (1024 * 1024), 1)
+
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+def benchmark_resolution(width, height, dialog_open):
+    """Render BENCHMARK_FRAMES frames at one window size and return the timing summary."""
+    global screen, CONFIRM_STATE, CONFIRM_SCALE
+
+    screen = pygame.display.set_mode((width, height), pygame.DOUBLEBUF)
+    CONFIRM_STATE = ConfirmState.OPEN if dialog_open else ConfirmState.CLOSED
+    CONFIRM_SCALE = 1.0 if dialog_open else 0.0
+
+    # Layout includes scaling the background through update_background
+    started = time.perf_counter()
+    rebuild_layout()
+    layout_ms = (time.perf_counter() - started) * 1000
+
+    frame_times = []
+    run_started = time.perf_counter()
+    for frame in range(BENCHMARK_FRAMES):
+        started = time.perf_counter()
+        render_frame(frame / ACTIVE_FRAME_RATE)
+        frame_times.append((time.perf_counter() - started) * 1000)
+        clock.tick()  # Unthrottled, only keeps the dialog animation's frame time current
+    run_seconds = time.perf_counter() - run_started
+
+    frame_times.sort()
+    def percentile(p):
+        return round(frame_times[min(len(frame_times) - 1, int(len(frame_times) * p / 100))], 3)
+
+    return {
+        "fps": round(BENCHMARK_FRAMES / run_seconds, 1),
+        "layout_ms": round(layout_ms, 3),
+        "p50_ms": percentile(50),
+        "p95_ms": percentile(95),
+        "p99_ms": percentile(99),
+        "max_ms": round(frame_times[-1], 3),
+        "peak_rss_mb": get_peak_rss_mb()
+    }
+
+def find_benchmark_regressions(results, previous):
+    """Compare two runs and describe every case that got noticeably slower."""
+    regressions = []
+    for case, result in results.items():
+        before = previous.get(case)
+        if before is None:
+            continue
+        if result["fps"] < before["fps"] * (1 - BENCHMARK_REGRESSION_TOLERANCE):
+            regressions.append(f"{case}: {before['fps']} -> {result['fps']} fps")
+        if (result["p99_ms"] > before["p99_ms"] * (1 + BENCHMARK_REGRESSION_TOLERANCE)
+                and result["p99_ms"] - before["p99_ms"] > BENCHMARK_NOISE_MS):
+            regressions.append(f"{case}: p99 {before['p99_ms']} -> {result['p99_ms']} ms")
+    return regressions
+
+def run_benchmark_case(size, mode):
+    """Benchmark one case (--benchmark-case WxH menu|dialog) on the dummy video driver and print it as JSON."""
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    init_display()
+
+    # Measure steady state, not decoding
+    for future in list(pending_artwork):
+        future.exception()
+    collect_decoded_artwork()
+
+    width, height = map(int, size.split("x"))
+    print(json.dumps(benchmark_resolution(width, height, mode == "dialog")))
+
+def run_benchmark():
+    """Run the benchmark suite, one process per case. Returns False if a regression was found."""
+    import subprocess
+    import pygame  # Only for its version, the cases render in their own processes
+
+    results = {}
+    print(f"{'case':<20}{'fps':>9}{'layout':>9}{'p50':>8}{'p95':>8}{'p99':>8}{'max':>8}{'rss MB':>9}")
+    for width, height in BENCHMARK_RESOLUTIONS:
+        for dialog_open in [False, True]:
+            case = f"{width}x{height} {'dialog' if dialog_open else 'menu'}"
+            # A fresh process per case, as peak RSS only ever grows within one
+            process = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--benchmark-case", f"{width}x{height}", case.split()[1]],
+                capture_output=True, text=True
+            )
+            if process.returncode != 0:
+                print(f"{case}: benchmark failed:\n{process.stderr}")
+                return False
+            result = json.loads(process.stdout.splitlines()[-1])
+            results[case] = result
+            print(f"{case:<20}{result['fps']:>9}{result['layout_ms']:>9.2f}{result['p50_ms']:>8.2f}"
+                  f"{result['p95_ms']:>8.2f}{result['p99_ms']:>8.2f}{result['max_ms']:>8.2f}{result['peak_rss_mb']:>9}")
+
+    # Load earlier runs, compare with the latest one that used the same frame count, then store this run
+    history = []
+    if os.path.exists(BENCHMARK_RESULTS_FILE):
+        try:
+            with open(BENCHMARK_RESULTS_FILE, "r") as f:
+                history = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not read {BENCHMARK_RESULTS_FILE}: {e}")
+
+    regressions = []
+    comparable = [run for run in history if run.get("frames") == BENCHMARK_FRAMES]
+    if comparable:
+        regressions = find_benchmark_regressions(results, comparable[-1]["results"])
+        print(f"Compared with the run from {comparable[-1]['date']}:")
+        for regression in regressions:
+            print(f"  REGRESSION {regression}")
+        if not regressions:
+            print("  No regressions.")
+
+    history.append({
+        "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "frames": BENCHMARK_FRAMES,
+        "python": sys.version.split()[0],
+        "pygame": pygame.version.ver,
+        "results": results
+    })
+    try:
+        with open(BENCHMARK_RESULTS_FILE, "w") as f:
+            json.dump(history[-BENCHMARK_HISTORY:], f, indent=4)
+    except OSError as e:
+        print(f"Error saving benchmark results: {e}")
+
+    return not regressions
+
 # Main Game Loop (with floating logo logic)
 def main():
     global config  # Make config global so it can be accessed in the game loop
+    global resident_mode
     
+    # Pack the launcher assets into a bundle and exit
+    if "--build-bundle" in sys.argv:
+        init_pygame()
+        build_asset_bundle()
+        return None
+
+    # Render a fixed number of headless frames per resolution and exit
+    if "--benchmark-case" in sys.argv:
+        case_index = sys.argv.index("--benchmark-case")
+        run_benchmark_case(sys.argv[case_index + 1], sys.argv[case_index + 2])
+        sys.exit(0)
+    if "--benchmark" in sys.argv:
+        sys.exit(0 if run_benchmark() else 1)
+
     # Load existing configuration
     config = load_config()
 
@@ -1161,12 +2859,25 @@ def main():
         return None  # Indicates game was launched
 
     # Check if all games are marked as "Not Installed"
-    if not config:
-        debug_log("No configuration file found. Running initial setup.", DEBUG)
-        config = prompt_for_all_paths()
-    elif all(value == "Not Installed" for key, value in config.items() if key in KH_REQUIRED_FILES):
-        # messagebox.showinfo("No Game Paths Set", "No game paths are selected. You will be prompted to select paths again.")
-        config = prompt_for_all_paths()
+    if not config or all(value == "Not Installed" for key, value in config.items() if key in KH_REQUIRED_FILES):
+        debug_log("No games configured. Running initial setup.", DEBUG)
+
+        # Take what Heroic's metadata knows, then search the disk for the rest.
+        # The prompts below only ask for what neither could settle
+        discovered = discover_installs()
+        unknown = [key for key in KH_REQUIRED_FILES if key not in discovered]
+        if unknown:
+            discovered.update(scan_for_installs_with_window(unknown))
+        if any(discovered.get(key) not in ["Not Installed", None] for key in KH_REQUIRED_FILES):
+            for key, value in discovered.items():
+                if key in KH_REQUIRED_FILES or key not in config:
+                    config[key] = value
+        else:
+            # messagebox.showinfo("No Game Paths Set", "No game paths are selected. You will be prompted to select paths again.")
+            config = prompt_for_all_paths()
+
+    # Check the configured paths, reusing cached results for paths that haven't changed
+    start_install_validation(config)
 
     # Prompt for Kingdom Hearts paths if not already configured
     kh_titles = {
@@ -1176,7 +2887,8 @@ def main():
     }
 
     for key, title in kh_titles.items():
-        if key not in config or (config.get(key) not in ["Not Installed", None] and not os.path.exists(config[key])):
+        if key not in config or (config.get(key) not in ["Not Installed", None] and not install_status.get(key)):
+            from tkinter import messagebox
             while True:
                 debug_log(f"Prompting for {title} installation folder.", DEBUG)
                 folder = prompt_for_folder(f"Select the installation folder for {title} or cancel to proceed without it.")
@@ -1190,21 +2902,24 @@ def main():
 
                 if validate_install_path(folder, KH_REQUIRED_FILES[key]):
                     config[key] = folder
+                    install_status[key] = True
                     break
                 else:
                     messagebox.showerror("Invalid Path", f"The selected folder is not a valid installation path for {title}. Please try again.")
 
     # Prompt for Heroic GamesConfig folder
-    if "HeroicGamesConfig" not in config:
+    if "HeroicGamesConfig" not in config or not install_status.get("HeroicGamesConfig"):
+        from tkinter import messagebox
         debug_log("Prompting for Heroic GamesConfig folder.", DEBUG)
         while True:
-            folder = prompt_for_folder("Select the Heroic GamesConfig folder (This should be found in AppData/Roaming/heroic/GamesConfig)", initialdir=appdata_folder)
+            folder = prompt_for_folder("Select the Heroic GamesConfig folder (This should be found in AppData/Roaming/heroic/GamesConfig)", initialdir=gamesconfig_default_path)
             if not folder:
                 messagebox.showerror("Missing Path", "You must select the Heroic GamesConfig folder to proceed. The launcher will now exit.")
                 sys.exit(1)
 
             if validate_gamesconfig_path(folder):
                 config["HeroicGamesConfig"] = folder
+                install_status["HeroicGamesConfig"] = True
                 break
             else:
                 messagebox.showerror("Invalid Path", "The selected folder is not a valid GamesConfig path or no games are installed via Heroic. Please try again.")
@@ -1213,15 +2928,30 @@ def main():
     if "HeroicPath" not in config:
         debug_log("Prompting for Heroic executable location.", DEBUG)
         config["HeroicPath"] = prompt_for_heroic_exe()
-        save_config(config)
-    elif not os.path.exists(config["HeroicPath"]):
+    elif not install_status.get("HeroicPath"):
         debug_log("Heroic executable not found at saved location.", DEBUG)
         config["HeroicPath"] = prompt_for_heroic_exe()
-        save_config(config)
         
-    # Save configuration
+    # Save configuration, once and only if the prompts changed anything
     save_config(config)
 
+    # Only now that the menu is needed, bring up pygame, the window and the assets
+    init_display()
+
+    # Prepare every game's GamesConfig content in the background, ahead of the first launch
+    get_launch_supervisor().submit(stage_game_configs, config)
+
+    # Get Heroic running while the user picks a game, if asked to
+    if prewarm_enabled(config):
+        start_heroic_prewarm(config)
+
+    # Stay in the background while games run, if asked to
+    resident_mode = "-resident" in sys.argv or config.get("ResidentMode") is True
+    if resident_mode and list_processes() is None:
+        # Waiting for the game needs its pid, and only the process list tells it apart from Heroic's helper
+        print("Warning: Resident mode needs a process list, which this system doesn't provide. The launcher will close after launching instead.")
+        resident_mode = False
+
     apply_deactivated_states(config)
     reapply_deactivated_states(config)
     
@@ -1232,46 +2962,55 @@ if __name__ == "__main__":
 
     if config is not None:
         running = True
-        fullscreen = False
-        previous_width, previous_height = screen.get_size()  # Store initial screen size
+        quit_after_launch = False  # Closing was asked for while a launch was in progress
 
-        # Initialize scaled_background with the current screen size
-        scaled_background = update_background(previous_width, previous_height)
+        # Build the canvas and layout once; they are rebuilt only on resize or fullscreen toggle
+        rebuild_layout()
 
-        # Store the initial logo size once
-        initial_logo_width = logo.get_width()
-        initial_logo_height = logo.get_height()
-
-        # Handle scaling the canvas to the window
-        window_width, window_height = screen.get_size()
-        canvas_rect = calculate_canvas_fit(window_width, window_height)
-        canvas = pygame.Surface((canvas_rect.width, canvas_rect.height))
+        # Start at the full frame rate
+        last_input_time = time.time()
 
         while running:
+            frame_started = time.perf_counter()
+
             # Get the current time
             current_time = pygame.time.get_ticks()
             elapsed_time = time.time() - start_time  # Time elapsed since the start
-            
-            # Detect if the window has been resized
-            current_width, current_height = screen.get_size()
-            
-            if current_width != previous_width or current_height != previous_height:
-                # The screen size has changed, so rescale the background
-                scaled_background = update_background(current_width, current_height)
-                previous_width, previous_height = current_width, current_height  # Update the previous size
+
+            # Pick up finished decodes and swap in the selection's artwork once it is ready
+            if pending_artwork:
+                collect_decoded_artwork()
+                show_selected_artwork()
+            prescale_next_background(*screen.get_size())
 
             # Handle exiting with ESC
-            for event in pygame.event.get():
-                if event.type == QUIT:
-                    running = False
-                elif event.type == KEYDOWN:
+            events = coalesce_input_events(get_frame_events())
+            phase_started = time.perf_counter()
+            for event in events:
+                track_activity(event)
+
+                # A launch in progress is seen through first, its worker can't be abandoned halfway
+                if event.type == pygame.QUIT:
+                    if CONFIRM_STATE == ConfirmState.LAUNCHING:
+                        quit_after_launch = True
+                    else:
+                        running = False
+                elif event.type == pygame.KEYDOWN:
                     # Handle ESC to quit
-                    if event.key == K_ESCAPE:
+                    if event.key == pygame.K_ESCAPE and CONFIRM_STATE != ConfirmState.LAUNCHING:
                         running = False
-                        
+
+                # The window was resized, so rebuild the canvas and layout
+                if event.type == pygame.VIDEORESIZE:
+                    rebuild_layout()
+
+                # Redraw everything when the window contents were lost
+                if event.type == pygame.VIDEOEXPOSE:
+                    request_full_redraw()
+
                 # Handle fullscreen toggle (F11 or Alt+Enter)
-                if event.type == KEYDOWN:
-                    if event.key == K_F11 or (event.key == K_RETURN and pygame.key.get_mods() & KMOD_ALT):
+                if event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_F11 or (event.key == pygame.K_RETURN and pygame.key.get_mods() & pygame.KMOD_ALT):
                         screen = toggle_fullscreen()
                         debug_log(f"Fullscreen toggled: {fullscreen}")
 
@@ -1279,63 +3018,63 @@ if __name__ == "__main__":
                 handle_input_and_states(event, config)
                         
                 # Confirm dialog        
-                if event.type == MOUSEMOTION:
+                if event.type == pygame.MOUSEMOTION:
                     handle_mouse_navigation(event)
                     if CONFIRM_STATE == ConfirmState.OPEN:
-                        handle_confirm_mouse(event.pos, canvas_rect)
-                elif event.type == MOUSEBUTTONDOWN:
+                        handle_confirm_mouse(event.pos)
+                elif event.type == pygame.MOUSEBUTTONDOWN:
                     if CONFIRM_STATE == ConfirmState.OPEN:
-                        handle_confirm_mouse_click(event, canvas_rect)
+                        handle_confirm_mouse_click(event)
                     else:
                         handle_mouse_selection(event)
 
                 # Handle confirm dialog input
                 handle_confirm_input(event)
 
-            # Handle PRESSED state timeout
-            handle_pressed_state()
+            profile_phase("events", phase_started)
 
-            # Ensure DEACTIVATED states persist after any state changes
-            reapply_deactivated_states(config)
-
-            # Handle scaling the canvas to the window
-            window_width, window_height = screen.get_size()
-            canvas_rect = calculate_canvas_fit(window_width, window_height)
-            canvas = pygame.Surface((canvas_rect.width, canvas_rect.height))
-
-            # Draw the scaled background onto the canvas
-            canvas.blit(scaled_background, (0, 0))
+            # Run the button state machine once for everything that arrived this frame
+            update_button_states(selected_button_index)
 
-            scale_factor = canvas_rect.width / ASSET_RESOLUTION[0]
-            scale_and_draw_buttons(canvas, canvas_rect.width / ASSET_RESOLUTION[0], elapsed_time)
+            # Pick up background install checks, storing the results once the last one is in
+            if pending_validations:
+                collect_install_validation(config)
+                if not pending_validations:
+                    save_config(config)
 
-            # Scale the logo according to the scale factor once
-            logo_scaled_width = int(logo.get_width() * scale_factor)
-            logo_scaled_height = int(logo.get_height() * scale_factor)
-            scaled_logo = pygame.transform.smoothscale(logo, (logo_scaled_width, logo_scaled_height))  # Scale logo
+            # Keep an eye on the warm Heroic
+            if prewarm_process is not None or prewarm_restart_at is not None:
+                poll_heroic_prewarm(config)
 
-            logo_rect = logo.get_rect()  # Update the rect with the new scaled size
+            # Handle PRESSED state timeout
+            handle_pressed_state()
 
-            # Animate the logo to float up and down
-            time_passed = pygame.time.get_ticks() / 1000  # Get the time in seconds
-            logo_x = int(canvas_rect.width * 0.3932)  # 39.32% of the screen width (adjust as needed)
-            logo_y_offset = math.sin(elapsed_time * FLOAT_SPEED) * (canvas_rect.height * FLOAT_AMPLITUDE)
-            logo_y = int(canvas_rect.height * 0.1935 + logo_y_offset)  # Update Y-position
-            logo_rect.topleft = (logo_x, logo_y + logo_y_offset)
+            # Ensure DEACTIVATED states persist after any state changes
+            reapply_deactivated_states(config)
 
-            # Draw the scaled logo over the background and buttons
-            canvas.blit(scaled_logo, (logo_x, logo_y + logo_y_offset))
+            # Close once the launch supervisor reports the game started, or wait for it in resident mode
+            if poll_launch():
+                if resident_mode and running_game_pid is not None and not quit_after_launch:
+                    run_resident(running_game_pid)
+                else:
+                    running = False
+            elif quit_after_launch and launch_future is None:
+                running = False
 
-            screen.fill(BLACK)
-            screen.blit(canvas, canvas_rect.topleft)
+            # Nothing is visible while minimized
+            if not window_minimized:
+                render_frame(elapsed_time)
+            end_profile_frame(frame_started)
 
-            # Draw the confirm dialog if it's active
-            if CONFIRM_STATE != ConfirmState.CLOSED:
-                scale_and_draw_confirm_dialog(canvas, scale_factor, elapsed_time)
-                screen.blit(canvas, canvas_rect.topleft)
+            # In the background the event wait already paced this frame
+            if window_in_background():
+                clock.tick()
+            else:
+                clock.tick(get_frame_rate())
 
-            pygame.display.flip()
-            clock.tick(60)
+        write_profile_trace()
+        stop_heroic_prewarm()
 
-pygame.quit()
-sys.exit()
+    if pygame is not None:
+        pygame.quit()
+    sys.exit()
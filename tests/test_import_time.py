@@ -0,0 +1,47 @@
+"""Startup budget: importing the launcher module must stay cheap, its heavy imports belong to the code using them."""
+import os
+import subprocess
+import sys
+
+LAUNCHER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "KINGDOM HEARTS Omni Lite Launcher.py")
+IMPORT_TIME_BUDGET_MS = 30
+MARKER = "launcher-module-start"
+
+# Imports the launcher in a fresh interpreter, marking where its own imports begin
+PROBE = (
+    "import importlib.util, sys\n"
+    "spec = importlib.util.spec_from_file_location('kh_omni_lite_launcher', sys.argv[1])\n"
+    "module = importlib.util.module_from_spec(spec)\n"
+    f"sys.stderr.write('import time: {MARKER}\\n')\n"
+    "spec.loader.exec_module(module)\n"
+)
+
+def get_launcher_imports():
+    """(cumulative ms, module) for every top-level import made by the launcher module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE, LAUNCHER],
+        capture_output=True, text=True
+    )
+    assert result.returncode == 0, f"Importing the launcher failed:\n{result.stderr}"
+
+    imports = []
+    lines = result.stderr.splitlines()
+    for line in lines[lines.index(f"import time: {MARKER}") + 1:]:
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if name.startswith("  "):
+            continue  # Nested import, already part of its parent's cumulative time
+        imports.append((int(cumulative) / 1000, name.strip()))
+    return imports
+
+def test_import_time_within_budget():
+    imports = get_launcher_imports()
+    total_ms = sum(ms for ms, name in imports)
+    slowest = ", ".join(f"{name} {ms:.2f} ms" for ms, name in sorted(imports, reverse=True)[:5])
+    assert total_ms <= IMPORT_TIME_BUDGET_MS, f"Launcher import time {total_ms:.2f} ms is over {IMPORT_TIME_BUDGET_MS} ms ({slowest})"
+
+def test_heavy_modules_not_imported():
+    names = {name for ms, name in get_launcher_imports()}
+    for module in ["tkinter", "ctypes", "pygame", "subprocess"]:
+        assert module not in names, f"{module} is imported at module level"